@@ -87,6 +87,9 @@ class WorkersConfig:
     worker_exit_timeout: float = 2.0
     """ How long does a worker can work on watcher exit before being cancelled. """
 
+    patching_inflight_limit: Optional[int] = 10
+    """ How many PATCH API calls can be in flight simultaneously (None -- unlimited). """
+
     @staticmethod
     def get_syn_executor() -> concurrent.futures.ThreadPoolExecutor:
         if not WorkersConfig.threadpool_executor:
@@ -10,7 +10,7 @@ the operators' code, and can lead to information loss or mismatch
 """
 import copy
 import logging
-from typing import Tuple, MutableMapping, Any
+from typing import Tuple, MutableMapping, Any, Optional
 
 from kopf import config
 from kopf.engines import posting
@@ -122,3 +122,24 @@ class ObjectLogger(logging.LoggerAdapter):
 
 logger = logging.getLogger('kopf.objects')
 logger.addHandler(K8sPoster())
+
+# The per-object loggers, cached by uid: the carried identifiers are immutable
+# for the object's lifetime, so one logger per object is enough -- instead of
+# one per watch-event, which is a notable allocation under the event bursts.
+_loggers: MutableMapping[str, ObjectLogger] = {}
+_LOGGERS_LIMIT = 4096
+
+
+def get_obj_logger(*, body: bodies.Body, uid: Optional[str] = None) -> ObjectLogger:
+    if uid is None:
+        uid = body.get('metadata', {}).get('uid')
+    if uid is None:
+        return ObjectLogger(body=body)  # artificial bodies, e.g. in tests.
+    try:
+        return _loggers[uid]
+    except KeyError:
+        obj_logger = ObjectLogger(body=body)
+        if len(_loggers) >= _LOGGERS_LIMIT:
+            _loggers.clear()
+        _loggers[uid] = obj_logger
+        return obj_logger
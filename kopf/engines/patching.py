@@ -0,0 +1,189 @@
+"""
+Applying the object patches in the background, coalesced per object.
+
+The handling routines accumulate all their changes in one patch object,
+and apply it once per handling cycle. Still, every application is one
+HTTP round-trip to the Kubernetes API, and the patches can be produced
+faster than they are applied (e.g. on the event bursts, or when multiple
+handling cycles are provoked within a short period of time).
+
+The patches are queued in-memory and applied in the background
+(same as the k8s-events are posted in the background: `kopf.engines.posting`).
+All the patches for the same object, which are queued by the moment
+of the actual patching, are merged into one API call.
+
+The patching falls back to the direct API calls when no background patcher
+task is running -- e.g. when the handling routines are invoked directly,
+not from an operator process (such as in the unit-tests of the operators).
+"""
+import asyncio
+import copy
+import logging
+import weakref
+from typing import MutableMapping, NamedTuple, NoReturn, Optional, Tuple, List, Dict, Any, \
+                   TYPE_CHECKING
+
+from kopf import config
+from kopf.clients import patching
+from kopf.structs import bodies
+from kopf.structs import patches
+from kopf.structs import resources
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    K8sPatchQueue = asyncio.Queue["K8sPatch"]
+else:
+    K8sPatchQueue = asyncio.Queue
+
+# An object is identified by its resource kind and its coordinates, not by the body identity:
+# the bodies differ across the watch-events even when they refer to the same object.
+ObjectKey = Tuple[resources.Resource, Optional[str], Optional[str]]
+
+
+class K8sPatch(NamedTuple):
+    """
+    A single object's patch to be applied, with all the identifying information.
+    """
+    resource: resources.Resource
+    body: bodies.Body
+    patch: patches.Patch
+
+
+# The client-side throttling of the PATCH API calls: only a limited number of them
+# can be in flight at once, so that the bulk operations (e.g. the initial listing
+# of tens of thousands of objects) do not overload the API server and do not get
+# HTTP 429s, which would only be amplified by the retries. The semaphores are
+# per-loop, as they cannot be shared across the loops (e.g. in the unit-tests).
+_semaphores: MutableMapping[asyncio.AbstractEventLoop, asyncio.Semaphore] = \
+    weakref.WeakKeyDictionary()
+
+
+async def _patch_obj_throttled(
+        *,
+        resource: resources.Resource,
+        patch: patches.Patch,
+        body: bodies.Body,
+) -> None:
+    limit = config.WorkersConfig.patching_inflight_limit
+    if limit is None:
+        await patching.patch_obj(resource=resource, patch=patch, body=body)
+        return
+    loop = asyncio.get_running_loop()
+    try:
+        semaphore = _semaphores[loop]
+    except KeyError:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(limit)
+    async with semaphore:
+        await patching.patch_obj(resource=resource, patch=patch, body=body)
+
+
+async def apply_obj(
+        *,
+        resource: resources.Resource,
+        patch: patches.Patch,
+        body: bodies.Body,
+        patch_queue: Optional[K8sPatchQueue] = None,
+) -> None:
+    """
+    Apply a patch to an object: either via the background patcher, or directly.
+
+    If the patch queue is given, the patch is only queued, and the actual
+    API call is done by the `patcher` background task -- possibly merged
+    with other patches of the same object queued by that moment.
+    """
+    if patch_queue is None:
+        await _patch_obj_throttled(resource=resource, patch=patch, body=body)
+    else:
+        await patch_queue.put(K8sPatch(resource=resource, body=body, patch=patch))
+
+
+async def patcher(
+        patch_queue: K8sPatchQueue,
+) -> NoReturn:
+    """
+    Apply the queued patches in the background, coalescing the bursts.
+
+    On every wake-up, everything queued by that moment is drained at once,
+    and the patches of the same object are merged into a single API call:
+    under the eventual consistency, only the merged result matters,
+    not the intermediate steps. The per-object order is preserved.
+
+    This task is spawned once per operator (see `kopf.reactor.running`),
+    same as the k8s-event poster task.
+    """
+    while True:
+        queued = [await patch_queue.get()]
+        try:
+            while True:
+                queued.append(patch_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            pass
+        # Different objects are patched concurrently, as the per-object workers
+        # would do it; the chunk of in-flight API calls is bounded by the semaphore.
+        coalesced = _coalesce(queued)
+        if len(coalesced) == 1:
+            await _apply_contained(coalesced[0])
+        else:
+            await asyncio.gather(*(_apply_contained(k8s_patch) for k8s_patch in coalesced))
+
+
+async def _apply_contained(
+        k8s_patch: K8sPatch,
+) -> None:
+    """
+    Apply one object's patch, containing its failures to that object only.
+
+    A failed PATCH call (e.g. HTTP 429/5xx under load) must not escape
+    to the root task and crash the operator -- the same way as the workers
+    contain the per-event handling errors.
+    """
+    try:
+        await _patch_obj_throttled(
+            resource=k8s_patch.resource,
+            patch=k8s_patch.patch,
+            body=k8s_patch.body)
+    except asyncio.CancelledError:
+        raise  # on py3.7, it is a subclass of Exception; cancellations must propagate.
+    except Exception:
+        meta = k8s_patch.body.get('metadata', {})
+        logger.exception(f"Failed to patch {k8s_patch.resource.name} "
+                         f"{meta.get('namespace')}/{meta.get('name')}. "
+                         f"Ignoring the patch.")
+
+
+def _coalesce(
+        queued: List[K8sPatch],
+) -> List[K8sPatch]:
+    """
+    Merge the queued patches of the same object into one patch per object.
+
+    The objects keep the order of their first appearance in the queue.
+    Within one object, the later patches override the earlier ones
+    (the same as if they were applied separately, one by one).
+    """
+    merged: Dict[ObjectKey, K8sPatch] = {}
+    for k8s_patch in queued:
+        meta = k8s_patch.body.get('metadata', {})
+        key: ObjectKey = (k8s_patch.resource, meta.get('namespace'), meta.get('name'))
+        if key in merged:
+            _merge(merged[key].patch, k8s_patch.patch)
+        else:
+            # Deep-copy the patch, so that the merging does not affect the original patches.
+            merged[key] = k8s_patch._replace(patch=patches.Patch(copy.deepcopy(k8s_patch.patch)))
+    return list(merged.values())
+
+
+def _merge(
+        dst: Dict[Any, Any],
+        src: Dict[Any, Any],
+) -> None:
+    """
+    Merge one (later) patch into another (earlier) one, the same way
+    as the JSON merge-patches would be merged by the API server.
+    """
+    for key, val in src.items():
+        if isinstance(val, dict) and isinstance(dst.get(key), dict):
+            _merge(dst[key], val)
+        else:
+            dst[key] = val
@@ -18,12 +18,30 @@ async def sleep_or_wait(
     the last moment before timing out; this is unlikely to happen though.
     """
     loop = asyncio.get_running_loop()
+
+    # If the event is already set, there is nothing to wait for: no tasks, no timers.
+    if event.is_set():
+        return max(0, delay)
+
+    # Unlike `asyncio.wait_for`, `asyncio.wait` communicates the timeout via the return
+    # value, not via an exception -- which would be raised and caught on every single
+    # uninterrupted sleep (i.e. the majority of them) otherwise.
+    start_time = loop.time()
+    wait_task = loop.create_task(event.wait())
     try:
-        start_time = loop.time()
-        await asyncio.wait_for(event.wait(), timeout=delay)
-    except asyncio.TimeoutError:
+        done, pending = await asyncio.wait({wait_task}, timeout=delay)
+    finally:
+        # `asyncio.wait` never cancels its awaitables -- neither on the timeout,
+        # nor when this sleep itself is cancelled (e.g. at the operator shutdown).
+        # Cancel & reap the waiter in all cases, do not leave it dangling.
+        if not wait_task.done():
+            wait_task.cancel()
+            try:
+                await wait_task
+            except asyncio.CancelledError:
+                pass
+    if not done:
         return None  # interruptable sleep is over: uninterrupted.
-    else:
-        end_time = loop.time()
-        duration = end_time - start_time
-        return max(0, delay - duration)
+    end_time = loop.time()
+    duration = end_time - start_time
+    return max(0, delay - duration)
@@ -18,10 +18,10 @@ import asyncio
 import collections.abc
 import datetime
 from contextvars import ContextVar
-from typing import Optional, Iterable, Collection, Any
+from typing import Optional, Iterable, Collection, Dict, List, Set, Any
 
-from kopf.clients import patching
 from kopf.engines import logging as logging_engine
+from kopf.engines import patching as patching_engine
 from kopf.engines import posting
 from kopf.engines import sleeping
 from kopf.reactor import causation
@@ -40,6 +40,9 @@ from kopf.structs import resources
 WAITING_KEEPALIVE_INTERVAL = 10 * 60
 """ How often to wake up from the long sleep, to show the liveliness. """
 
+_HANDLER_REASONS = frozenset(causation.HANDLER_REASONS)
+""" Same as `causation.HANDLER_REASONS`, but for the per-event membership tests. """
+
 DEFAULT_RETRY_DELAY = 1 * 60
 """ The default delay duration for the regular exception in retry-mode. """
 
@@ -84,6 +87,7 @@ async def resource_handler(
         freeze: asyncio.Event,
         replenished: asyncio.Event,
         event_queue: posting.K8sEventQueue,
+        patch_queue: Optional[patching_engine.K8sPatchQueue] = None,
 ) -> None:
     """
     Handle a single custom object low-level watch-event.
@@ -98,8 +102,11 @@ async def resource_handler(
     patch: patches.Patch = patches.Patch()
     delay: Optional[float] = None
 
+    # The identifying fields are used all over the handling; resolve them once.
+    view = bodies.build_body_view(body)
+
     # Each object has its own prefixed logger, to distinguish parallel handling.
-    logger = logging_engine.ObjectLogger(body=body)
+    logger = logging_engine.get_obj_logger(body=body, uid=view.uid)
     posting.event_queue_loop_var.set(asyncio.get_running_loop())
     posting.event_queue_var.set(event_queue)  # till the end of this object's task.
 
@@ -126,41 +133,53 @@ async def resource_handler(
     # Detect the cause and handle it (or at least log this happened).
     if registry.has_resource_changing_handlers(resource=resource):
         extra_fields = registry.get_extra_fields(resource=resource)
-        old, new, diff = lastseen.get_essential_diffs(body=body, extra_fields=extra_fields)
-        resource_changing_cause = causation.detect_resource_changing_cause(
-            event=event,
-            resource=resource,
-            logger=logger,
-            patch=patch,
-            old=old,
-            new=new,
-            diff=diff,
-            requires_finalizer=registry.requires_finalizer(resource=resource, body=body),
-        )
-        delay = await handle_resource_changing_cause(
-            lifecycle=lifecycle,
-            registry=registry,
-            cause=resource_changing_cause,
-        )
+
+        # The delayed handlers are retried locally: when the sleep is not interrupted,
+        # no new events have arrived, so the body is still up to date, and the handling
+        # can be repeated in-place -- instead of provoking a watch-event via a dummy
+        # patch, which would cost one PATCH API call per wake-up per object.
+        while True:
+            old, new, diff = lastseen.get_essential_diffs(body=body, extra_fields=extra_fields,
+                                                          view=view)
+            resource_changing_cause = causation.detect_resource_changing_cause(
+                event=event,
+                resource=resource,
+                logger=logger,
+                patch=patch,
+                old=old,
+                new=new,
+                diff=diff,
+                requires_finalizer=registry.requires_finalizer(resource=resource, body=body),
+            )
+            delay = await handle_resource_changing_cause(
+                lifecycle=lifecycle,
+                registry=registry,
+                cause=resource_changing_cause,
+            )
+
+            # Any patch interrupts the sleeping: it provokes a watch-event itself,
+            # and that event continues the handling cycle with a fresh body.
+            if not delay or patch:
+                break
+
+            # Sleep strictly after patching, never before -- to keep the status proper.
+            # Sleeping happens here only with an empty patch, so this is guaranteed.
+            logger.debug(f"Sleeping for {delay} seconds for the delayed handlers.")
+            unslept = await sleeping.sleep_or_wait(delay, replenished)
+            if unslept is not None:
+                logger.debug(f"Sleeping was interrupted by new changes, {unslept} seconds left.")
+                break
+            if freeze.is_set():  # e.g. when a peer operator has taken over while sleeping.
+                logger.debug("Ignoring the delayed handlers due to freeze.")
+                break
+            logger.debug("Re-checking the delayed handlers: no new changes have arrived.")
 
     # Whatever was done, apply the accumulated changes to the object.
     # But only once, to reduce the number of API calls and the generated irrelevant events.
     if patch:
         logger.debug("Patching with: %r", patch)
-        await patching.patch_obj(resource=resource, patch=patch, body=body)
-
-    # Sleep strictly after patching, never before -- to keep the status proper.
-    # The patching above, if done, interrupts the sleep instantly, so we skip it at all.
-    if delay and not patch:
-        logger.debug(f"Sleeping for {delay} seconds for the delayed handlers.")
-        unslept = await sleeping.sleep_or_wait(delay, replenished)
-        if unslept is not None:
-            logger.debug(f"Sleeping was interrupted by new changes, {unslept} seconds left.")
-        else:
-            now = datetime.datetime.utcnow()
-            dummy = patches.Patch({'status': {'kopf': {'dummy': now.isoformat()}}})
-            logger.debug("Provoking reaction with: %r", dummy)
-            await patching.patch_obj(resource=resource, patch=dummy, body=body)
+        await patching_engine.apply_obj(resource=resource, patch=patch, body=body,
+                                        patch_queue=patch_queue)
 
 
 async def handle_resource_watching_cause(
@@ -180,24 +199,26 @@ async def handle_resource_watching_cause(
     """
     logger = cause.logger
     handlers = registry.get_resource_watching_handlers(cause=cause)
-    for handler in handlers:
 
-        # The exceptions are handled locally and are not re-raised, to keep the operator running.
-        try:
-            logger.debug(f"Invoking handler {handler.id!r}.")
+    # The sub-handlers' lifecycle is the same for all the handlers of one cycle: set it once.
+    with invocation.context([(sublifecycle_var, lifecycle)]):
+        for handler in handlers:
 
-            result = await _call_handler(
-                handler,
-                cause=cause,
-                lifecycle=lifecycle,
-            )
+            # The exceptions are handled locally and are not re-raised, to keep the operator running.
+            try:
+                logger.debug(f"Invoking handler {handler.id!r}.")
 
-        except Exception:
-            logger.exception(f"Handler {handler.id!r} failed with an exception. Will ignore.", local=True)
+                result = await _call_handler(
+                    handler,
+                    cause=cause,
+                )
 
-        else:
-            logger.info(f"Handler {handler.id!r} succeeded.", local=True)
-            state.store_result(patch=cause.patch, handler=handler, result=result)
+            except Exception:
+                logger.exception(f"Handler {handler.id!r} failed with an exception. Will ignore.", local=True)
+
+            else:
+                logger.info(f"Handler {handler.id!r} succeeded.", local=True)
+                state.store_result(patch=cause.patch, handler=handler, result=result)
 
 
 async def handle_resource_changing_cause(
@@ -211,13 +232,15 @@ async def handle_resource_changing_cause(
     logger = cause.logger
     patch = cause.patch  # TODO get rid of this alias
     body = cause.body  # TODO get rid of this alias
+    reason = cause.reason
     delay = None
     done = None
     skip = None
 
-    # Regular causes invoke the handlers.
-    if cause.reason in causation.HANDLER_REASONS:
-        title = causation.TITLES.get(cause.reason, repr(cause.reason))
+    # Regular causes invoke the handlers. The reasons are mutually exclusive,
+    # so one if-elif chain goes through the checks at most once per event.
+    if reason in _HANDLER_REASONS:
+        title = causation.TITLES.get(reason, repr(reason))
         logger.debug(f"{title.capitalize()} event: %r", body)
         if cause.diff is not None and cause.old is not None and cause.new is not None:
             logger.debug(f"{title.capitalize()} diff: %r", cause.diff)
@@ -240,24 +263,24 @@ async def handle_resource_changing_cause(
         else:
             skip = True
 
-    # Regular causes also do some implicit post-handling when all handlers are done.
-    if done or skip:
-        extra_fields = registry.get_extra_fields(resource=cause.resource)
-        lastseen.refresh_essence(body=body, patch=patch, extra_fields=extra_fields)
-        if done:
-            state.purge_progress(body=body, patch=patch)
-        if cause.reason == causation.Reason.DELETE:
-            logger.debug("Removing the finalizer, thus allowing the actual deletion.")
-            finalizers.remove_finalizers(body=body, patch=patch)
+        # Regular causes also do some implicit post-handling when all handlers are done.
+        if done or skip:
+            extra_fields = registry.get_extra_fields(resource=cause.resource)
+            lastseen.refresh_essence(body=body, patch=patch, extra_fields=extra_fields)
+            if done:
+                state.purge_progress(body=body, patch=patch)
+            if reason == causation.Reason.DELETE:
+                logger.debug("Removing the finalizer, thus allowing the actual deletion.")
+                finalizers.remove_finalizers(body=body, patch=patch)
 
     # Informational causes just print the log lines.
-    if cause.reason == causation.Reason.GONE:
+    elif reason == causation.Reason.GONE:
         logger.debug("Deleted, really deleted, and we are notified.")
 
-    if cause.reason == causation.Reason.FREE:
+    elif reason == causation.Reason.FREE:
         logger.debug("Deletion event, but we are done with it, and we do not care.")
 
-    if cause.reason == causation.Reason.NOOP:
+    elif reason == causation.Reason.NOOP:
         logger.debug("Something has changed, but we are not interested (state is the same).")
 
     # For the case of a newly created object, or one that doesn't have the correct
@@ -265,13 +288,13 @@ async def handle_resource_changing_cause(
     # produce an 'ACQUIRE' causation event. This only happens when there are
     # mandatory deletion handlers registered for the given object, i.e. if finalizers
     # are required.
-    if cause.reason == causation.Reason.ACQUIRE:
+    elif reason == causation.Reason.ACQUIRE:
         logger.debug("Adding the finalizer, thus preventing the actual deletion.")
         finalizers.append_finalizers(body=body, patch=patch)
 
     # Remove finalizers from an object, since the object currently has finalizers, but
     # shouldn't, thus releasing the locking of the object to this operator.
-    if cause.reason == causation.Reason.RELEASE:
+    elif reason == causation.Reason.RELEASE:
         logger.debug("Removing the finalizer, as there are no handlers requiring it.")
         finalizers.remove_finalizers(body=body, patch=patch)
 
@@ -306,47 +329,54 @@ async def execute(
     # Restore the current context as set in the handler execution cycle.
     lifecycle = lifecycle if lifecycle is not None else sublifecycle_var.get()
     cause = cause if cause is not None else cause_var.get()
-    handler: registries.ResourceHandler = handler_var.get()
 
-    # Validate the inputs; the function signatures cannot put these kind of restrictions, so we do.
-    if len([v for v in [fns, handlers, registry] if v is not None]) > 1:
-        raise TypeError("Only one of the fns, handlers, registry can be passed. Got more.")
+    # The sub-handlers are only for upper-level causes, not for lower-level events.
+    # Checked before any registry construction -- to fail fast, with no wasted work.
+    if not isinstance(cause, causation.ResourceChangingCause):
+        raise RuntimeError("Sub-handlers of event-handlers are not supported and have "
+                           "no practical use (there are no retries or state tracking).")
 
-    elif fns is not None and isinstance(fns, collections.abc.Mapping):
-        registry = registries.ResourceRegistry(prefix=handler.id if handler else None)
-        for id, fn in fns.items():
-            registry.register(fn=fn, id=id)
+    # The most common case: no explicit args, i.e. the implicit execution of the accumulated
+    # sub-handlers from `@kopf.on.this`. Checked first, before any argument validation,
+    # since this is the hot path (it happens after every handler with sub-handlers).
+    if fns is None and handlers is None and registry is None:
+        if subexecuted_var.get():
+            return  # prevent the double implicit execution.
+        subexecuted_var.set(True)
+        registry = subregistry_var.get()
 
-    elif fns is not None and isinstance(fns, collections.abc.Iterable):
-        registry = registries.ResourceRegistry(prefix=handler.id if handler else None)
-        for fn in fns:
-            registry.register(fn=fn)
+    else:
+        handler: registries.ResourceHandler = handler_var.get()
 
-    elif fns is not None:
-        raise ValueError(f"fns must be a mapping or an iterable, got {fns.__class__}.")
+        # Validate the inputs; the function signatures cannot put these kind of restrictions.
+        if (fns is not None) + (handlers is not None) + (registry is not None) > 1:
+            raise TypeError("Only one of the fns, handlers, registry can be passed. Got more.")
 
-    elif handlers is not None:
-        registry = registries.ResourceRegistry(prefix=handler.id if handler else None)
-        for handler in handlers:
-            registry.append(handler=handler)
+        elif fns is not None and isinstance(fns, collections.abc.Mapping):
+            registry = registries.ResourceRegistry(prefix=handler.id if handler else None)
+            for id, fn in fns.items():
+                registry.register(fn=fn, id=id)
 
-    # Use the registry as is; assume that the caller knows what they do.
-    elif registry is not None:
-        pass
+        elif fns is not None and isinstance(fns, collections.abc.Iterable):
+            registry = registries.ResourceRegistry(prefix=handler.id if handler else None)
+            for fn in fns:
+                registry.register(fn=fn)
 
-    # Prevent double implicit execution.
-    elif subexecuted_var.get():
-        return
+        elif fns is not None:
+            raise ValueError(f"fns must be a mapping or an iterable, got {fns.__class__}.")
 
-    # If no explicit args were passed, implicitly use the accumulated handlers from `@kopf.on.this`.
-    else:
-        subexecuted_var.set(True)
-        registry = subregistry_var.get()
+        elif handlers is not None:
+            registry = registries.ResourceRegistry(prefix=handler.id if handler else None)
+            for handler in handlers:
+                registry.append(handler=handler)
 
-    # The sub-handlers are only for upper-level causes, not for lower-level events.
-    if not isinstance(cause, causation.ResourceChangingCause):
-        raise RuntimeError("Sub-handlers of event-handlers are not supported and have "
-                           "no practical use (there are no retries or state tracking).")
+        # Use the registry as is; assume that the caller knows what they do.
+        elif registry is not None:
+            pass
+
+    # By this point, the registry is always there: either from the sub-registry
+    # of the implicit execution, or built/passed explicitly above.
+    assert registry is not None  # for type-checking; unreachable otherwise
 
     # Execute the real handlers (all or few or one of them, as per the lifecycle).
     # Raises `HandlerChildrenRetry` if the execute should be continued on the next iteration.
@@ -380,104 +410,168 @@ async def _execute(
     """
     logger = cause.logger
 
-    # Filter and select the handlers to be executed right now, on this event reaction cycle.
-    handlers_done = [h for h in handlers if state.is_finished(body=cause.body, handler=h)]
-    handlers_wait = [h for h in handlers if state.is_sleeping(body=cause.body, handler=h)]
-    handlers_todo = [h for h in handlers if state.is_awakened(body=cause.body, handler=h)]
-    handlers_plan = [h for h in await invocation.invoke(lifecycle, handlers_todo, cause=cause)]
-    handlers_left = [h for h in handlers_todo if h.id not in {h.id for h in handlers_plan}]
+    # A single point in time for all the time checks and calculations of this cycle.
+    # Taking the current time is not free, and it is needed 2-3 times per handler otherwise.
+    now = datetime.datetime.utcnow()
 
-    # Set the timestamps -- even if not executed on this event, but just got registered.
+    # The root of the progress structure, resolved once per cycle instead of per handler.
+    progress = state.get_progress(body=cause.body)
+
+    # Filter and select the handlers to be executed right now, on this event reaction cycle.
+    # One pass over the handlers, with one walk over the progress structure per handler.
+    handlers_wait: List[registries.ResourceHandler] = []
+    handlers_todo: List[registries.ResourceHandler] = []
     for handler in handlers:
-        if not state.is_started(body=cause.body, handler=handler):
+        handler_state = state.classify(body=cause.body, handler=handler, now=now, progress=progress)
+        if handler_state is state.HandlerState.SLEEPING:
+            handlers_wait.append(handler)
+        elif handler_state is state.HandlerState.AWAKENED:
+            handlers_todo.append(handler)
+
+        # Set the timestamps -- even if not executed on this event, but just got registered.
+        if not state.is_started(body=cause.body, handler=handler, progress=progress):
             state.set_start_time(body=cause.body, patch=cause.patch, handler=handler)
 
-    # Execute all planned (selected) handlers in one event reaction cycle, even if there are few.
-    for handler in handlers_plan:
-
-        # Restore the handler's progress status. It can be useful in the handlers.
-        retry = state.get_retry_count(body=cause.body, handler=handler)
-        started = state.get_start_time(body=cause.body, handler=handler, patch=cause.patch)
-        runtime = datetime.datetime.utcnow() - (started if started else datetime.datetime.utcnow())
-
-        # The exceptions are handled locally and are not re-raised, to keep the operator running.
-        try:
-            logger.debug(f"Invoking handler {handler.id!r}.")
-
-            if handler.timeout is not None and runtime.total_seconds() > handler.timeout:
-                raise HandlerTimeoutError(f"Handler {handler.id!r} has timed out after {runtime}.")
-
-            result = await _call_handler(
-                handler,
-                cause=cause,
-                retry=retry,
-                started=started,
-                runtime=runtime,
-                lifecycle=lifecycle,  # just a default for the sub-handlers, not used directly.
-            )
-
-        # Unfinished children cause the regular retry, but with less logging and event reporting.
-        except HandlerChildrenRetry as e:
-            logger.debug(f"Handler {handler.id!r} has unfinished sub-handlers. Will retry soon.")
-            state.set_retry_time(body=cause.body, patch=cause.patch, handler=handler, delay=e.delay)
-            handlers_left.append(handler)
-
-        # Definitely a temporary error, regardless of the error strictness.
-        except TemporaryError as e:
-            logger.error(f"Handler {handler.id!r} failed temporarily: %s", str(e) or repr(e))
-            state.set_retry_time(body=cause.body, patch=cause.patch, handler=handler, delay=e.delay)
-            handlers_left.append(handler)
-
-        # Same as permanent errors below, but with better logging for our internal cases.
-        except HandlerTimeoutError as e:
-            logger.error(f"%s", str(e) or repr(e))  # already formatted
-            state.store_failure(body=cause.body, patch=cause.patch, handler=handler, exc=e)
-            # TODO: report the handling failure somehow (beside logs/events). persistent status?
+    # The lifecycle has nothing to plan from an empty list, so do not even invoke it:
+    # the invocation is not free (kwargs preparation, possibly an executor round-trip).
+    handlers_plan = ([] if not handlers_todo else
+                     [h for h in await invocation.invoke(lifecycle, handlers_todo, cause=cause)])
 
-        # Definitely a permanent error, regardless of the error strictness.
-        except PermanentError as e:
-            logger.error(f"Handler {handler.id!r} failed permanently: %s", str(e) or repr(e))
-            state.store_failure(body=cause.body, patch=cause.patch, handler=handler, exc=e)
-            # TODO: report the handling failure somehow (beside logs/events). persistent status?
+    # The unfinished handlers are tracked by id only: they are never called in this cycle,
+    # only checked for presence in the end -- to decide if the cycle must be retried.
+    left_ids = {h.id for h in handlers_todo}.difference(h.id for h in handlers_plan)
 
-        # Regular errors behave as either temporary or permanent depending on the error strictness.
-        except Exception as e:
-            if retry_on_errors:
-                logger.exception(f"Handler {handler.id!r} failed with an exception. Will retry.")
-                state.set_retry_time(body=cause.body, patch=cause.patch, handler=handler, delay=DEFAULT_RETRY_DELAY)
-                handlers_left.append(handler)
-            else:
-                logger.exception(f"Handler {handler.id!r} failed with an exception. Will stop.")
-                state.store_failure(body=cause.body, patch=cause.patch, handler=handler, exc=e)
-                # TODO: report the handling failure somehow (beside logs/events). persistent status?
+    # The per-field old/new/diff narrowing is the same for all the handlers of one field
+    # within one cycle (the cause is immutable), so it is computed once per unique field.
+    field_cache: Dict[dicts.FieldPath, Any] = {}
 
-        # No errors means the handler should be excluded from future runs in this reaction cycle.
-        else:
-            logger.info(f"Handler {handler.id!r} succeeded.")
-            state.store_success(body=cause.body, patch=cause.patch, handler=handler, result=result)
+    # Execute all planned (selected) handlers in one event reaction cycle, even if there are few.
+    # The handlers planned for one step are independent by design, and are mostly I/O-bound
+    # (API calls), so they are executed concurrently: the step takes the time of the slowest
+    # handler, not the sum of all of them. The sequential or partial execution, if needed,
+    # is the lifecycle's responsibility (e.g. `one_by_one`): it plans the handlers per step.
+    # A single planned handler (the most common case) is awaited directly, with no task setup.
+    # The sub-handlers' lifecycle is the same for all the handlers of one cycle: set it once,
+    # not per handler -- the context-var setting/resetting is not free on the hot path.
+    with invocation.context([(sublifecycle_var, lifecycle)]):
+        if len(handlers_plan) == 1:
+            await _execute_handler(
+                handler=handlers_plan[0], cause=cause, now=now, progress=progress,
+                field_cache=field_cache, left_ids=left_ids, retry_on_errors=retry_on_errors)
+        elif handlers_plan:
+            await asyncio.gather(*(
+                _execute_handler(
+                    handler=handler, cause=cause, now=now, progress=progress,
+                    field_cache=field_cache, left_ids=left_ids, retry_on_errors=retry_on_errors)
+                for handler in handlers_plan))
 
     # Provoke the retry of the handling cycle if there were any unfinished handlers,
     # either because they were not selected by the lifecycle, or failed and need a retry.
-    if handlers_left:
+    if left_ids:
         raise HandlerChildrenRetry(delay=None)
 
     # If there are delayed handlers, block this object's cycle; but do keep-alives every few mins.
     # Other (non-delayed) handlers will continue as normlally, due to raise few lines above.
     # Other objects will continue as normally in their own handling asyncio tasks.
     if handlers_wait:
-        now = datetime.datetime.utcnow()
+        now = datetime.datetime.utcnow()  # again: the handlers above could run for long.
         limit = now + datetime.timedelta(seconds=WAITING_KEEPALIVE_INTERVAL)
-        times = [state.get_awake_time(body=cause.body, handler=h) for h in handlers_wait]
+        times = [state.get_awake_time(body=cause.body, handler=h, progress=progress)
+                 for h in handlers_wait]
         until = min([t for t in times if t is not None] + [limit])  # the soonest awake datetime.
         delay = max(0, (until - now).total_seconds())
         raise HandlerChildrenRetry(delay=delay)
 
 
+async def _execute_handler(
+        *,
+        handler: registries.ResourceHandler,
+        cause: causation.BaseCause,
+        now: datetime.datetime,
+        progress: Any,
+        field_cache: Dict[dicts.FieldPath, Any],
+        left_ids: Set[registries.HandlerId],
+        retry_on_errors: bool,
+) -> None:
+    """
+    Execute one planned handler, with all of its error handling.
+
+    This is the body of the per-cycle execution, extracted so that several
+    planned handlers can run concurrently (see `_execute`). The shared
+    accumulators (the cause's patch, the left-over ids) are only mutated
+    in synchronous blocks with no awaits in between, so no locking is
+    needed under the cooperative asyncio scheduling.
+    """
+    logger = cause.logger
+
+    # Restore the handler's progress status. It can be useful in the handlers.
+    retry = state.get_retry_count(body=cause.body, handler=handler, progress=progress)
+    started = state.get_start_time(body=cause.body, handler=handler, patch=cause.patch,
+                                   progress=progress)
+    runtime = now - (started if started else now)
+
+    # The exceptions are handled locally and are not re-raised, to keep the operator running.
+    try:
+        logger.debug(f"Invoking handler {handler.id!r}.")
+
+        if handler.timeout is not None and runtime.total_seconds() > handler.timeout:
+            raise HandlerTimeoutError(f"Handler {handler.id!r} has timed out after {runtime}.")
+
+        result = await _call_handler(
+            handler,
+            cause=cause,
+            field_cache=field_cache,
+            retry=retry,
+            started=started,
+            runtime=runtime,
+        )
+
+    # Unfinished children cause the regular retry, but with less logging and event reporting.
+    except HandlerChildrenRetry as e:
+        logger.debug(f"Handler {handler.id!r} has unfinished sub-handlers. Will retry soon.")
+        state.set_retry_time(body=cause.body, patch=cause.patch, handler=handler, delay=e.delay)
+        left_ids.add(handler.id)
+
+    # Definitely a temporary error, regardless of the error strictness.
+    except TemporaryError as e:
+        logger.error(f"Handler {handler.id!r} failed temporarily: %s", str(e) or repr(e))
+        state.set_retry_time(body=cause.body, patch=cause.patch, handler=handler, delay=e.delay)
+        left_ids.add(handler.id)
+
+    # Same as permanent errors below, but with better logging for our internal cases.
+    except HandlerTimeoutError as e:
+        logger.error(f"%s", str(e) or repr(e))  # already formatted
+        state.store_failure(body=cause.body, patch=cause.patch, handler=handler, exc=e)
+        # TODO: report the handling failure somehow (beside logs/events). persistent status?
+
+    # Definitely a permanent error, regardless of the error strictness.
+    except PermanentError as e:
+        logger.error(f"Handler {handler.id!r} failed permanently: %s", str(e) or repr(e))
+        state.store_failure(body=cause.body, patch=cause.patch, handler=handler, exc=e)
+        # TODO: report the handling failure somehow (beside logs/events). persistent status?
+
+    # Regular errors behave as either temporary or permanent depending on the error strictness.
+    except Exception as e:
+        if retry_on_errors:
+            logger.exception(f"Handler {handler.id!r} failed with an exception. Will retry.")
+            state.set_retry_time(body=cause.body, patch=cause.patch, handler=handler, delay=DEFAULT_RETRY_DELAY)
+            left_ids.add(handler.id)
+        else:
+            logger.exception(f"Handler {handler.id!r} failed with an exception. Will stop.")
+            state.store_failure(body=cause.body, patch=cause.patch, handler=handler, exc=e)
+            # TODO: report the handling failure somehow (beside logs/events). persistent status?
+
+    # No errors means the handler should be excluded from future runs in this reaction cycle.
+    else:
+        logger.info(f"Handler {handler.id!r} succeeded.")
+        state.store_success(body=cause.body, patch=cause.patch, handler=handler, result=result)
+
+
 async def _call_handler(
         handler: registries.ResourceHandler,
         *args: Any,
         cause: causation.BaseCause,
-        lifecycle: lifecycles.LifeCycleFn,
+        field_cache: Optional[Dict[dicts.FieldPath, Any]] = None,
         **kwargs: Any,
 ) -> Any:
     """
@@ -487,21 +581,28 @@ async def _call_handler(
 
     Ensure the global context for this asyncio task is set to the handler and
     its cause -- for proper population of the sub-handlers via the decorators
-    (see `@kopf.on.this`).
+    (see `@kopf.on.this`). The sub-handlers' lifecycle (`sublifecycle_var`)
+    is the same for the whole cycle, and is set by the calling loops.
     """
 
     # For the field-handlers, the old/new/diff values must match the field, not the whole object.
+    # The narrowing walks the whole old/new/diff structures, so it is cached per unique field
+    # when many handlers of one cycle watch the same field (the cache is per cycle, see `_execute`).
     if isinstance(cause, causation.ResourceChangingCause) and handler.field is not None:
-        old = dicts.resolve(cause.old, handler.field, None, assume_empty=True)
-        new = dicts.resolve(cause.new, handler.field, None, assume_empty=True)
-        diff = diffs.reduce(cause.diff, handler.field)
+        if field_cache is not None and handler.field in field_cache:
+            old, new, diff = field_cache[handler.field]
+        else:
+            old = dicts.resolve(cause.old, handler.field, None, assume_empty=True)
+            new = dicts.resolve(cause.new, handler.field, None, assume_empty=True)
+            diff = diffs.reduce(cause.diff, handler.field)
+            if field_cache is not None:
+                field_cache[handler.field] = (old, new, diff)
         cause = causation.enrich_cause(cause=cause, old=old, new=new, diff=diff)
 
     # Store the context of the current resource-object-event-handler, to be used in `@kopf.on.this`,
     # and maybe other places, and consumed in the recursive `execute()` calls for the children.
     # This replaces the multiple kwargs passing through the whole call stack (easy to forget).
     with invocation.context([
-        (sublifecycle_var, lifecycle),
         (subregistry_var, registries.ResourceRegistry(prefix=handler.id)),
         (subexecuted_var, False),
         (handler_var, handler),
@@ -516,7 +617,10 @@ async def _call_handler(
             **kwargs,
         )
 
-        if not subexecuted_var.get() and isinstance(cause, causation.ResourceChangingCause):
+        # Most of the handlers do not register the sub-handlers at all. If so, skip
+        # the implicit execution completely, not just make it a no-op deep inside.
+        if not subexecuted_var.get() and isinstance(cause, causation.ResourceChangingCause) \
+                and subregistry_var.get():
             await execute()
 
         return result
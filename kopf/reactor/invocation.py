@@ -110,14 +110,28 @@ async def invoke(
     return result
 
 
-def is_async_fn(
+def _detect_async_fn(
         fn: Optional[Invokable],
 ) -> bool:
     if fn is None:
         return False
     elif isinstance(fn, functools.partial):
-        return is_async_fn(fn.func)
+        return _detect_async_fn(fn.func)
     elif hasattr(fn, '__wrapped__'):  # @functools.wraps()
-        return is_async_fn(fn.__wrapped__)  # type: ignore
+        return _detect_async_fn(fn.__wrapped__)  # type: ignore
     else:
         return asyncio.iscoroutinefunction(fn)
+
+
+# The sync/async nature of a callable never changes, while the detection walks
+# the whole partial/wrapper chain -- so the verdicts are cached per callable.
+_detect_async_fn_cached = functools.lru_cache(maxsize=1024)(_detect_async_fn)
+
+
+def is_async_fn(
+        fn: Optional[Invokable],
+) -> bool:
+    try:
+        return _detect_async_fn_cached(fn)
+    except TypeError:  # unhashable callables are not cached
+        return _detect_async_fn(fn)
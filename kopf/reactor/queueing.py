@@ -27,7 +27,7 @@ import asyncio
 import enum
 import logging
 import time
-from typing import Tuple, Union, MutableMapping, NewType, NamedTuple, TYPE_CHECKING, cast
+from typing import Optional, Tuple, Union, MutableMapping, NewType, NamedTuple, TYPE_CHECKING, cast
 
 import aiojobs
 from typing_extensions import Protocol
@@ -77,6 +77,7 @@ async def watcher(
         namespace: Union[None, str],
         resource: resources.Resource,
         handler: WatcherCallback,
+        freeze: Optional[asyncio.Event] = None,
 ) -> None:
     """
     The watchers watches for the resource events via the API, and spawns the handlers for every object.
@@ -107,7 +108,8 @@ async def watcher(
                 streams[key] = Stream(watchevents=asyncio.Queue(), replenished=asyncio.Event())
                 streams[key].replenished.set()  # interrupt current sleeps, if any.
                 await streams[key].watchevents.put(event)
-                await scheduler.spawn(worker(handler=handler, streams=streams, key=key))
+                await scheduler.spawn(worker(handler=handler, streams=streams, key=key,
+                                             freeze=freeze))
     finally:
         # Allow the existing workers to finish gracefully before killing them.
         await _wait_for_depletion(scheduler=scheduler, streams=streams)
@@ -120,6 +122,7 @@ async def worker(
         handler: WatcherCallback,
         streams: Streams,
         key: ObjectRef,
+        freeze: Optional[asyncio.Event] = None,
 ) -> None:
     """
     The per-object workers consume the object's events and invoke the handler.
@@ -167,6 +170,12 @@ async def worker(
             if isinstance(event, EOS):
                 break
 
+            # If the processing is globally frozen (e.g. this operator has yielded to another
+            # operator), discard the event without even dispatching the handler: the handler
+            # would discard it anyway, but with the per-event invocation overhead paid first.
+            if freeze is not None and freeze.is_set():
+                continue
+
             # Try the handler. In case of errors, show the error, but continue the queue processing.
             replenished.clear()
             try:
@@ -256,10 +256,21 @@ class OperatorRegistry(BaseRegistry):
     _resource_watching_handlers: MutableMapping[resources_.Resource, ResourceRegistry]
     _resource_changing_handlers: MutableMapping[resources_.Resource, ResourceRegistry]
 
+    # How many memoized handler selections are kept before the cache is reset.
+    # The variety is usually small (per resource/reason/filters), but the diffed
+    # fields are part of the key, so the worst case must be limited.
+    _cache_limit = 1000
+
     def __init__(self) -> None:
         super().__init__()
         self._resource_watching_handlers = {}
         self._resource_changing_handlers = {}
+        self._resource_changing_cache: MutableMapping[Any, Sequence[ResourceHandler]] = {}
+        self._resource_changing_version = 0
+        self._extra_fields_cache: MutableMapping[resources_.Resource, Set[dicts.FieldPath]] = {}
+        self._requires_finalizer_cache: MutableMapping[Any, bool] = {}
+        self._filtered_label_keys: Set[str] = set()
+        self._filtered_annotation_keys: Set[str] = set()
 
     @property
     def resources(self) -> FrozenSet[resources_.Resource]:
@@ -308,8 +319,65 @@ class OperatorRegistry(BaseRegistry):
         registry.register(reason=reason, event=event, field=field, fn=fn, id=id, timeout=timeout,
                           initial=initial, requires_finalizer=requires_finalizer,
                           labels=labels, annotations=annotations)
+
+        # Invalidate the memoized handler selections, and remember the filtered
+        # metadata keys -- only they participate in the memoization keys.
+        self._resource_changing_version += 1
+        self._extra_fields_cache.clear()
+        if labels:
+            self._filtered_label_keys.update(labels)
+        if annotations:
+            self._filtered_annotation_keys.update(annotations)
+
         return fn  # to be usable as a decorator too.
 
+    def get_resource_changing_handlers(
+            self,
+            cause: causation.ResourceChangingCause,
+    ) -> Sequence[ResourceHandler]:
+        """
+        Same as in the base class, but with memoization.
+
+        The handler selection is a pure function of the filter-relevant parts
+        of the cause (resource, reason, diffed fields, filtered metadata),
+        and it is called on every single watch-event -- so it is worth caching.
+        """
+        try:
+            key = self._resource_changing_cause_digest(cause)
+        except TypeError:
+            # Unhashable values in the cause (unlikely, but possible): select as usual.
+            return super().get_resource_changing_handlers(cause=cause)
+        if key not in self._resource_changing_cache:
+            if len(self._resource_changing_cache) >= self._cache_limit:
+                self._resource_changing_cache.clear()
+            self._resource_changing_cache[key] = \
+                super().get_resource_changing_handlers(cause=cause)
+        return self._resource_changing_cache[key]
+
+    def _resource_changing_cause_digest(
+            self,
+            cause: causation.ResourceChangingCause,
+    ) -> Any:
+        """
+        A cheap hashable digest of everything that affects the handler selection.
+
+        The registry version invalidates the memoized selections implicitly
+        when the new handlers are registered. Only the label/annotation keys
+        used in the handlers' filters are taken from the body, not all of them
+        (the bodies carry highly volatile annotations, e.g. the last-seen state).
+        """
+        labels = cause.body.get('metadata', {}).get('labels', {})
+        annotations = cause.body.get('metadata', {}).get('annotations', {})
+        return (
+            self._resource_changing_version,
+            cause.resource,
+            cause.reason,
+            cause.initial,
+            frozenset(field for _, field, _, _ in cause.diff or []),
+            tuple((key, labels.get(key)) for key in sorted(self._filtered_label_keys)),
+            tuple((key, annotations.get(key)) for key in sorted(self._filtered_annotation_keys)),
+        )
+
     def has_resource_watching_handlers(
             self,
             resource: resources_.Resource,
@@ -346,6 +414,19 @@ class OperatorRegistry(BaseRegistry):
         if resource_registry is not None:
             yield from resource_registry.iter_resource_changing_handlers(cause=cause)
 
+    def get_extra_fields(
+            self,
+            resource: resources_.Resource,
+    ) -> Set[dicts.FieldPath]:
+        """
+        Same as in the base class, but with memoization: the set of the extra
+        fields only changes when the new handlers are registered, while this
+        method is called on every single watch-event.
+        """
+        if resource not in self._extra_fields_cache:
+            self._extra_fields_cache[resource] = super().get_extra_fields(resource=resource)
+        return self._extra_fields_cache[resource]
+
     def iter_extra_fields(
             self,
             resource: resources_.Resource,
@@ -362,11 +443,33 @@ class OperatorRegistry(BaseRegistry):
         """
         Return whether a finalizer should be added to
         the given resource or not.
+
+        Memoized the same way as the handler selection: the answer is a pure
+        function of the resource and the filtered metadata of the body, while
+        the check otherwise re-matches all the finalizer-requiring handlers
+        on every single watch-event.
         """
         resource_registry = self._resource_changing_handlers.get(resource, None)
         if resource_registry is None:
             return False
-        return resource_registry.requires_finalizer(resource, body)
+        try:
+            labels = body.get('metadata', {}).get('labels', {})
+            annotations = body.get('metadata', {}).get('annotations', {})
+            key = (
+                self._resource_changing_version,
+                resource,
+                tuple((key, labels.get(key)) for key in sorted(self._filtered_label_keys)),
+                tuple((key, annotations.get(key)) for key in sorted(self._filtered_annotation_keys)),
+            )
+        except TypeError:
+            # Unhashable values in the metadata (unlikely, but possible): check as usual.
+            return resource_registry.requires_finalizer(resource, body)
+        if key not in self._requires_finalizer_cache:
+            if len(self._requires_finalizer_cache) >= self._cache_limit:
+                self._requires_finalizer_cache.clear()
+            self._requires_finalizer_cache[key] = \
+                resource_registry.requires_finalizer(resource, body)
+        return self._requires_finalizer_cache[key]
 
     #
     # Backward-compatibility of a semi-public interface: registries are exposed,
@@ -8,6 +8,7 @@ import warnings
 from typing import (Optional, Collection, Union, Tuple, Set, Text, Any, Coroutine,
                     cast, TYPE_CHECKING)
 
+from kopf.engines import patching as patching_engine
 from kopf.engines import peering
 from kopf.engines import posting
 from kopf.reactor import handling
@@ -109,6 +110,7 @@ async def spawn_tasks(
     lifecycle = lifecycle if lifecycle is not None else lifecycles.get_default_lifecycle()
     registry = registry if registry is not None else registries.get_default_registry()
     event_queue: posting.K8sEventQueue = asyncio.Queue(loop=loop)
+    patch_queue: patching_engine.K8sPatchQueue = asyncio.Queue(loop=loop)
     freeze_flag: asyncio.Event = asyncio.Event(loop=loop)
     signal_flag: asyncio_Future = asyncio.Future(loop=loop)
     tasks = []
@@ -130,6 +132,13 @@ async def spawn_tasks(
             event_queue=event_queue))),
     ])
 
+    # Object patching. Patches are queued in-memory and applied in the background,
+    # with the patches of the same object coalesced into one API call.
+    tasks.extend([
+        loop.create_task(_root_task_checker("patcher of objects", patching_engine.patcher(
+            patch_queue=patch_queue))),
+    ])
+
     # Monitor the peers, unless explicitly disabled.
     ourselves: Optional[peering.Peer] = peering.Peer.detect(
         id=peering.detect_own_id(), priority=priority,
@@ -153,11 +162,13 @@ async def spawn_tasks(
             loop.create_task(_root_task_checker(f"watcher of {resource.name}", queueing.watcher(
                 namespace=namespace,
                 resource=resource,
+                freeze=freeze_flag,  # the workers skip the events when frozen
                 handler=functools.partial(handling.resource_handler,
                                           lifecycle=lifecycle,
                                           registry=registry,
                                           resource=resource,
                                           event_queue=event_queue,
+                                          patch_queue=patch_queue,
                                           freeze=freeze_flag)))),  # freeze is only checked
         ])
 
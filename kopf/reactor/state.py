@@ -52,6 +52,7 @@ and collide with each other (especially critical for multiple updates).
 import collections.abc
 import copy
 import datetime
+import enum
 from typing import Any, Optional
 
 from kopf.reactor import registries
@@ -59,12 +60,66 @@ from kopf.structs import bodies
 from kopf.structs import patches
 
 
+class HandlerState(enum.Enum):
+    """ The condition of one handler in the current handling cycle. """
+    FINISHED = enum.auto()
+    SLEEPING = enum.auto()
+    AWAKENED = enum.auto()
+
+
+def get_progress(
+        *,
+        body: bodies.Body,
+) -> Any:
+    """
+    Get the root of the handler progress structure with a single walk.
+
+    The result can be passed to the read-only accessors below as ``progress=``,
+    so that the ``status.kopf.progress`` path is not resolved from scratch for
+    every handler of the cycle. The writers are unaffected: they modify the
+    patch, not the body, so the retrieved root stays valid within one cycle.
+    """
+    return body.get('status', {}).get('kopf', {}).get('progress', {})
+
+
+def classify(
+        *,
+        body: bodies.Body,
+        handler: registries.ResourceHandler,
+        now: Optional[datetime.datetime] = None,
+        progress: Optional[Any] = None,
+) -> HandlerState:
+    """
+    Classify a handler as finished, sleeping, or awakened.
+
+    Same as the `is_finished`/`is_sleeping`/`is_awakened` predicates,
+    but with a single walk over the progress structure instead of one
+    walk per predicate -- for the hot per-event partitioning of handlers.
+
+    The "now" timestamp can be passed when many handlers are classified
+    at once, so that the current time is taken only once per cycle
+    (and so that the whole cycle sees one consistent point in time).
+    """
+    if progress is None:
+        progress = get_progress(body=body)
+    record = progress.get(handler.id, {})
+    if record.get('success', None) or record.get('failure', None):
+        return HandlerState.FINISHED
+    delayed = record.get('delayed', None)
+    ts = None if delayed is None else datetime.datetime.fromisoformat(delayed)
+    if ts is not None and ts > (now if now is not None else datetime.datetime.utcnow()):
+        return HandlerState.SLEEPING
+    return HandlerState.AWAKENED
+
+
 def is_started(
         *,
         body: bodies.Body,
         handler: registries.ResourceHandler,
+        progress: Optional[Any] = None,
 ) -> bool:
-    progress = body.get('status', {}).get('kopf', {}).get('progress', {})
+    if progress is None:
+        progress = get_progress(body=body)
     return handler.id in progress
 
 
@@ -73,9 +128,7 @@ def is_sleeping(
         body: bodies.Body,
         handler: registries.ResourceHandler,
 ) -> bool:
-    ts = get_awake_time(body=body, handler=handler)
-    finished = is_finished(body=body, handler=handler)
-    return not finished and ts is not None and ts > datetime.datetime.utcnow()
+    return classify(body=body, handler=handler) is HandlerState.SLEEPING
 
 
 def is_awakened(
@@ -83,9 +136,7 @@ def is_awakened(
         body: bodies.Body,
         handler: registries.ResourceHandler,
 ) -> bool:
-    finished = is_finished(body=body, handler=handler)
-    sleeping = is_sleeping(body=body, handler=handler)
-    return bool(not finished and not sleeping)
+    return classify(body=body, handler=handler) is HandlerState.AWAKENED
 
 
 def is_finished(
@@ -93,10 +144,7 @@ def is_finished(
         body: bodies.Body,
         handler: registries.ResourceHandler,
 ) -> bool:
-    progress = body.get('status', {}).get('kopf', {}).get('progress', {})
-    success = progress.get(handler.id, {}).get('success', None)
-    failure = progress.get(handler.id, {}).get('failure', None)
-    return bool(success or failure)
+    return classify(body=body, handler=handler) is HandlerState.FINISHED
 
 
 def get_start_time(
@@ -104,10 +152,12 @@ def get_start_time(
         body: bodies.Body,
         patch: patches.Patch,
         handler: registries.ResourceHandler,
+        progress: Optional[Any] = None,
 ) -> Optional[datetime.datetime]:
-    progress = patch.get('status', {}).get('kopf', {}).get('progress', {})
-    new_value = progress.get(handler.id, {}).get('started', None)
-    progress = body.get('status', {}).get('kopf', {}).get('progress', {})
+    patch_progress = patch.get('status', {}).get('kopf', {}).get('progress', {})
+    new_value = patch_progress.get(handler.id, {}).get('started', None)
+    if progress is None:
+        progress = get_progress(body=body)
     old_value = progress.get(handler.id, {}).get('started', None)
     value = new_value or old_value
     return None if value is None else datetime.datetime.fromisoformat(value)
@@ -117,8 +167,10 @@ def get_awake_time(
         *,
         body: bodies.Body,
         handler: registries.ResourceHandler,
+        progress: Optional[Any] = None,
 ) -> Optional[datetime.datetime]:
-    progress = body.get('status', {}).get('kopf', {}).get('progress', {})
+    if progress is None:
+        progress = get_progress(body=body)
     value = progress.get(handler.id, {}).get('delayed', None)
     return None if value is None else datetime.datetime.fromisoformat(value)
 
@@ -127,8 +179,10 @@ def get_retry_count(
         *,
         body: bodies.Body,
         handler: registries.ResourceHandler,
+        progress: Optional[Any] = None,
 ) -> int:
-    progress = body.get('status', {}).get('kopf', {}).get('progress', {})
+    if progress is None:
+        progress = get_progress(body=body)
     return progress.get(handler.id, {}).get('retries', None) or 0
 
 
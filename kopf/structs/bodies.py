@@ -41,6 +41,7 @@ In case the operators are also type-checked, type casting can be used
     and object-processing functions. The internal dicts will remain the same.
 """
 
+import dataclasses
 from typing import Any, Mapping, Union, List, Optional, cast
 
 from typing_extensions import TypedDict, Literal
@@ -77,6 +78,37 @@ class Body(TypedDict, total=False):
     status: Status
 
 
+@dataclasses.dataclass(frozen=True)
+class BodyView:
+    """
+    The frequently used identifying fields of a body, resolved once.
+
+    The nested dict lookups (``body['metadata']['uid']`` and the likes)
+    are repeated for nearly every aspect of the handling of one watch-event:
+    logging, caching, patching, diffing. The view resolves them once per
+    event, and is passed along instead of re-walking the body every time.
+    The body itself is carried too, for when the full structure is needed.
+    """
+    body: Body
+    uid: Optional[str] = None
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+    resource_version: Optional[str] = None
+
+
+def build_body_view(
+        body: Body,
+) -> BodyView:
+    meta = body.get('metadata', {})
+    return BodyView(
+        body=body,
+        uid=meta.get('uid'),
+        name=meta.get('name'),
+        namespace=meta.get('namespace'),
+        resource_version=meta.get('resourceVersion'),
+    )
+
+
 #
 # Body/Meta essences only contain the fields relevant for object diff tracking.
 # They are presented to the user as part of the diff's `old`/`new` fields & kwargs.
@@ -25,6 +25,42 @@ from kopf.structs import patches
 LAST_SEEN_ANNOTATION = 'kopf.zalando.org/last-handled-configuration'
 """ The annotation name for the last stored state of the resource. """
 
+# The memoized essences/diffs of the recently seen bodies. An object never changes
+# without getting a new resourceVersion, so the result is a pure function of the key.
+# The same object is usually seen several times in a row (events, reaction cycles),
+# so this saves the repeated deep-copying and diffing of the same body.
+_diffs_cache: Dict[Any, Tuple[Optional[bodies.BodyEssence],
+                              Optional[bodies.BodyEssence],
+                              diffs.Diff]] = {}
+_DIFFS_CACHE_LIMIT = 4096
+
+
+def _diffs_cache_key(
+        body: bodies.Body,
+        extra_fields: Optional[Iterable[dicts.FieldSpec]],
+        view: Optional[bodies.BodyView] = None,
+) -> Optional[Any]:
+    """
+    A hashable digest of everything the essence-diffing depends on.
+
+    ``None`` means "not cacheable": e.g. for the artificial bodies
+    without the uid or the resourceVersion (as in some unit-tests).
+    """
+    if view is not None:
+        uid = view.uid
+        resource_version = view.resource_version
+    else:
+        meta = body.get('metadata', {})
+        uid = meta.get('uid')
+        resource_version = meta.get('resourceVersion')
+    if uid is None or resource_version is None:
+        return None
+    try:
+        extra_key = None if extra_fields is None else frozenset(extra_fields)
+        return (uid, resource_version, extra_key)
+    except TypeError:
+        return None  # unhashable extra-fields: not cacheable.
+
 
 def get_essence(
         body: bodies.Body,
@@ -97,10 +133,25 @@ def has_essence_stored(
 def get_essential_diffs(
         body: bodies.Body,
         extra_fields: Optional[Iterable[dicts.FieldSpec]] = None,
+        view: Optional[bodies.BodyView] = None,
 ) -> Tuple[Optional[bodies.BodyEssence], Optional[bodies.BodyEssence], diffs.Diff]:
+    extra_fields = list(extra_fields) if extra_fields is not None else None
+    key = _diffs_cache_key(body, extra_fields, view=view)
+    if key is not None and key in _diffs_cache:
+        # Serve a copy, never the cached original: the result flows into the
+        # user-side handlers as the old/new/diff kwargs, and their in-place
+        # mutations must not corrupt the cache for the next cycles.
+        return copy.deepcopy(_diffs_cache[key])
     old: Optional[bodies.BodyEssence] = retrieve_essence(body)
     new: Optional[bodies.BodyEssence] = get_essence(body, extra_fields=extra_fields)
-    return old, new, diffs.diff(old, new)
+    result = (old, new, diffs.diff(old, new))
+    if key is not None:
+        if len(_diffs_cache) >= _DIFFS_CACHE_LIMIT:
+            _diffs_cache.clear()
+        # Store a pristine copy for the same reason: the original is returned
+        # to the caller and can be mutated there.
+        _diffs_cache[key] = copy.deepcopy(result)
+    return result
 
 
 def retrieve_essence(
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from kopf.structs.finalizers import FINALIZER
+from kopf.structs.lastseen import LAST_SEEN_ANNOTATION
+
+# The json strings are inlined as literals; the asserts guard them against
+# any change in json's formatting (they vanish under ``python -O``).
+SPEC_DATA = {'spec': {'field': 'value'}}
+SPEC_JSON = '{"spec": {"field": "value"}}'
+ALT_DATA = {'spec': {'field': 'other'}}
+ALT_JSON = '{"spec": {"field": "other"}}'
+assert SPEC_JSON == json.dumps(SPEC_DATA)
+assert ALT_JSON == json.dumps(ALT_DATA)
+
+#
+# The detection factors as parametrized fixtures rather than stacked
+# parametrize marks: the fixture path is cheaper in pytest's collection
+# phase (no per-combination mark merging), and the combinations stay
+# restricted to each test's own subset -- nothing is skipped at runtime.
+#
+
+@pytest.fixture(params=['DELETED'])
+def deleted_event(request):
+    return request.param
+
+
+# The detection only distinguishes 'DELETED' and None (initial) event types;
+# 'ADDED' and 'MODIFIED' go through identical code paths, so one of them is enough,
+# plus an unknown type for the forward compatibility.
+@pytest.fixture(params=['MODIFIED', 'FORWARD-COMPATIBILITY-PSEUDO-EVENT'],
+                ids=['MODIFIED', 'COMPAT'])
+def regular_event(request):
+    return request.param
+
+
+# The presence/absence of our own finalizer; the cases which only differ by the
+# irrelevant finalizers are equivalent for the detection and are not multiplied.
+@pytest.fixture(params=[{}, {'finalizers': [FINALIZER]}],
+                ids=['no-finalizers', 'own-finalizer'])
+def some_finalizers(request):
+    return request.param
+
+
+@pytest.fixture(params=[{'finalizers': [FINALIZER]},
+                        {'finalizers': ['irrelevant', FINALIZER, 'another']}],
+                ids=['own-finalizer', 'mixed-finalizers'])
+def our_finalizers(request):
+    return request.param
+
+
+@pytest.fixture(params=[{}, {'finalizers': ['irrelevant', 'another']}],
+                ids=['no-finalizers', 'other-finalizers'])
+def no_finalizers(request):
+    return request.param
+
+
+@pytest.fixture(params=[{}, {'deletionTimestamp': None}, {'deletionTimestamp': 'some'}],
+                ids=['no-deletion-ts', 'empty-deletion-ts', 'real-deletion-ts'])
+def all_deletions(request):
+    return request.param
+
+
+@pytest.fixture(params=[{'deletionTimestamp': 'some'}],
+                ids=['real-deletion-ts'])
+def real_deletions(request):
+    return request.param
+
+
+@pytest.fixture(params=[{}, {'deletionTimestamp': None}],
+                ids=['no-deletion-ts', 'empty-deletion-ts'])
+def no_deletions(request):
+    return request.param
+
+
+@pytest.fixture(params=[{}, {'annotations': {}}],
+                ids=['no-annotations', 'no-last-seen'])
+def absent_lastseen(request):
+    return request.param
+
+
+@pytest.fixture(params=[{'annotations': {LAST_SEEN_ANNOTATION: SPEC_JSON}}],
+                ids=['matching-last-seen'])
+def matching_lastseen(request):
+    return request.param
+
+
+@pytest.fixture(params=[{'annotations': {LAST_SEEN_ANNOTATION: ALT_JSON}}],
+                ids=['mismatching-last-seen'])
+def mismatching_lastseen(request):
+    return request.param
+
+
+@pytest.fixture(params=[True], ids=['requires-finalizer'])
+def requires_finalizer(request):
+    return request.param
+
+
+@pytest.fixture(params=[False], ids=['doesnt-require-finalizer'])
+def doesnt_require_finalizer(request):
+    return request.param
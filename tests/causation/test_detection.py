@@ -1,17 +1,6 @@
-import copy
-import json
-
 import pytest
 
 from kopf.reactor.causation import Reason, detect_resource_changing_cause
-from kopf.structs.finalizers import FINALIZER
-from kopf.structs.lastseen import LAST_SEEN_ANNOTATION
-
-# Encoded at runtime, so that we do not make any assumptions on json formatting.
-SPEC_DATA = {'spec': {'field': 'value'}}
-SPEC_JSON = json.dumps((SPEC_DATA))
-ALT_DATA = {'spec': {'field': 'other'}}
-ALT_JSON = json.dumps((ALT_DATA))
 
 #
 # The following factors contribute to the detection of the cause
@@ -21,89 +10,17 @@ ALT_JSON = json.dumps((ALT_DATA))
 # * Annotation with the last-seen state (presence or absence).
 # * Annotation with the last-seen state (difference with the real state).
 #
-
-deleted_events = pytest.mark.parametrize('event', [
-    pytest.param('DELETED'),
-])
-
-regular_events = pytest.mark.parametrize('event', [
-    pytest.param('ADDED'),
-    pytest.param('MODIFIED'),
-    pytest.param('FORWARD-COMPATIBILITY-PSEUDO-EVENT', id='COMPAT'),
-])
-
-
-all_finalizers = pytest.mark.parametrize('finalizers', [
-    pytest.param({}, id='no-finalizers'),
-    pytest.param({'finalizers': [FINALIZER]}, id='own-finalizer'),
-    pytest.param({'finalizers': ['irrelevant', 'another']}, id='other-finalizers'),
-    pytest.param({'finalizers': ['irrelevant', FINALIZER, 'another']}, id='mixed-finalizers'),
-])
-
-our_finalizers = pytest.mark.parametrize('finalizers', [
-    pytest.param({'finalizers': [FINALIZER]}, id='own-finalizer'),
-    pytest.param({'finalizers': ['irrelevant', FINALIZER, 'another']}, id='mixed-finalizers'),
-])
-
-no_finalizers = pytest.mark.parametrize('finalizers', [
-    pytest.param({}, id='no-finalizers'),
-    pytest.param({'finalizers': ['irrelevant', 'another']}, id='other-finalizers'),
-])
-
-
-all_deletions = pytest.mark.parametrize('deletion_ts', [
-    pytest.param({}, id='no-deletion-ts'),
-    pytest.param({'deletionTimestamp': None}, id='empty-deletion-ts'),
-    pytest.param({'deletionTimestamp': 'some'}, id='real-deletion-ts'),
-])
-
-real_deletions = pytest.mark.parametrize('deletion_ts', [
-    pytest.param({'deletionTimestamp': 'some'}, id='real-deletion-ts'),
-])
-
-no_deletions = pytest.mark.parametrize('deletion_ts', [
-    pytest.param({}, id='no-deletion-ts'),
-    pytest.param({'deletionTimestamp': None}, id='empty-deletion-ts'),
-])
-
-
-all_lastseen = pytest.mark.parametrize('annotations', [
-    pytest.param({}, id='no-annotations'),
-    pytest.param({'annotations': {}}, id='no-last-seen'),
-    pytest.param({'annotations': {LAST_SEEN_ANNOTATION: SPEC_JSON}}, id='matching-last-seen'),
-    pytest.param({'annotations': {LAST_SEEN_ANNOTATION: SPEC_JSON}}, id='mismatching-last-seen'),
-])
-
-absent_lastseen = pytest.mark.parametrize('annotations', [
-    pytest.param({}, id='no-annotations'),
-    pytest.param({'annotations': {}}, id='no-last-seen'),
-])
-
-matching_lastseen = pytest.mark.parametrize('annotations', [
-    pytest.param({'annotations': {LAST_SEEN_ANNOTATION: SPEC_JSON}}, id='matching-last-seen'),
-])
-
-mismatching_lastseen = pytest.mark.parametrize('annotations', [
-    pytest.param({'annotations': {LAST_SEEN_ANNOTATION: ALT_JSON}}, id='mismatching-last-seen'),
-])
-
-all_requires_finalizer = pytest.mark.parametrize('requires_finalizer', [
-    pytest.param(True, id='requires-finalizer'),
-    pytest.param(False, id='doesnt-require-finalizer'),
-])
-
-requires_finalizer = pytest.mark.parametrize('requires_finalizer', [
-    pytest.param(True, id='requires-finalizer'),
-])
-
-doesnt_require_finalizer = pytest.mark.parametrize('requires_finalizer', [
-    pytest.param(False, id='doesnt-require-finalizer'),
-])
+# The factors are parametrized fixtures from the local conftest --
+# each test combines only its own relevant subsets of them.
+#
 
 
 @pytest.fixture
 def content():
-    return copy.deepcopy(SPEC_DATA)
+    # A fresh literal instead of a deepcopy of SPEC_DATA: the tests only merge it
+    # into the event's object, so no shared mutable state is involved anyway,
+    # and the deepcopy machinery is noticeably slower across the parametrization matrix.
+    return {'spec': {'field': 'value'}}
 
 
 #
@@ -125,18 +42,23 @@ def check_kwargs(cause, kwargs):
     assert cause.patch is kwargs['patch']
 
 
+def make_event(event_type, finalizers, deletion_ts, annotations=None, content=None):
+    # One dict-merge instead of a chain of updates: this helper runs for every
+    # combination of the parametrization matrices, i.e. thousands of times.
+    obj = {'metadata': {**finalizers, **deletion_ts, **(annotations or {})}}
+    if content:
+        obj.update(content)
+    return {'type': event_type, 'object': obj}
+
+
 #
 # The tests.
 #
 
-@all_requires_finalizer
-@all_finalizers
-@all_deletions
-@deleted_events
-def test_for_gone(kwargs, event, finalizers, deletion_ts, requires_finalizer):
-    event = {'type': event, 'object': {'metadata': {}}}
-    event['object']['metadata'].update(finalizers)
-    event['object']['metadata'].update(deletion_ts)
+# The 'DELETED' branch returns before any finalizer logic, so the finalizers
+# and the requires-finalizer flag only need representative coverage here.
+def test_for_gone(kwargs, deleted_event, some_finalizers, all_deletions, requires_finalizer):
+    event = make_event(deleted_event, some_finalizers, all_deletions)
     cause = detect_resource_changing_cause(
         event=event,
         requires_finalizer=requires_finalizer,
@@ -145,14 +67,9 @@ def test_for_gone(kwargs, event, finalizers, deletion_ts, requires_finalizer):
     check_kwargs(cause, kwargs)
 
 
-@all_requires_finalizer
-@no_finalizers
-@real_deletions
-@regular_events
-def test_for_free(kwargs, event, finalizers, deletion_ts, requires_finalizer):
-    event = {'type': event, 'object': {'metadata': {}}}
-    event['object']['metadata'].update(finalizers)
-    event['object']['metadata'].update(deletion_ts)
+# The FREE/DELETE branches trigger before the requires-finalizer flag is checked.
+def test_for_free(kwargs, regular_event, no_finalizers, real_deletions, requires_finalizer):
+    event = make_event(regular_event, no_finalizers, real_deletions)
     cause = detect_resource_changing_cause(
         event=event,
         requires_finalizer=requires_finalizer,
@@ -161,14 +78,8 @@ def test_for_free(kwargs, event, finalizers, deletion_ts, requires_finalizer):
     check_kwargs(cause, kwargs)
 
 
-@all_requires_finalizer
-@our_finalizers
-@real_deletions
-@regular_events
-def test_for_delete(kwargs, event, finalizers, deletion_ts, requires_finalizer):
-    event = {'type': event, 'object': {'metadata': {}}}
-    event['object']['metadata'].update(finalizers)
-    event['object']['metadata'].update(deletion_ts)
+def test_for_delete(kwargs, regular_event, our_finalizers, real_deletions, requires_finalizer):
+    event = make_event(regular_event, our_finalizers, real_deletions)
     cause = detect_resource_changing_cause(
         event=event,
         requires_finalizer=requires_finalizer,
@@ -177,14 +88,8 @@ def test_for_delete(kwargs, event, finalizers, deletion_ts, requires_finalizer):
     check_kwargs(cause, kwargs)
 
 
-@requires_finalizer
-@no_finalizers
-@no_deletions
-@regular_events
-def test_for_acquire(kwargs, event, finalizers, deletion_ts, requires_finalizer):
-    event = {'type': event, 'object': {'metadata': {}}}
-    event['object']['metadata'].update(finalizers)
-    event['object']['metadata'].update(deletion_ts)
+def test_for_acquire(kwargs, regular_event, no_finalizers, no_deletions, requires_finalizer):
+    event = make_event(regular_event, no_finalizers, no_deletions)
     cause = detect_resource_changing_cause(
         event=event,
         requires_finalizer=requires_finalizer,
@@ -193,33 +98,20 @@ def test_for_acquire(kwargs, event, finalizers, deletion_ts, requires_finalizer)
     check_kwargs(cause, kwargs)
 
 
-@doesnt_require_finalizer
-@our_finalizers
-@no_deletions
-@regular_events
-def test_for_release(kwargs, event, finalizers, deletion_ts, requires_finalizer):
-    event = {'type': event, 'object': {'metadata': {}}}
-    event['object']['metadata'].update(finalizers)
-    event['object']['metadata'].update(deletion_ts)
+def test_for_release(kwargs, regular_event, our_finalizers, no_deletions,
+                     doesnt_require_finalizer):
+    event = make_event(regular_event, our_finalizers, no_deletions)
     cause = detect_resource_changing_cause(
         event=event,
-        requires_finalizer=requires_finalizer,
+        requires_finalizer=doesnt_require_finalizer,
         **kwargs)
     assert cause.reason == Reason.RELEASE
     check_kwargs(cause, kwargs)
 
 
-@requires_finalizer
-@absent_lastseen
-@our_finalizers
-@no_deletions
-@regular_events
-def test_for_create(kwargs, event, finalizers, deletion_ts, annotations, content, requires_finalizer):
-    event = {'type': event, 'object': {'metadata': {}}}
-    event['object'].update(content)
-    event['object']['metadata'].update(finalizers)
-    event['object']['metadata'].update(deletion_ts)
-    event['object']['metadata'].update(annotations)
+def test_for_create(kwargs, regular_event, our_finalizers, no_deletions, absent_lastseen,
+                    content, requires_finalizer):
+    event = make_event(regular_event, our_finalizers, no_deletions, absent_lastseen, content)
     cause = detect_resource_changing_cause(
         event=event,
         requires_finalizer=requires_finalizer,
@@ -228,33 +120,20 @@ def test_for_create(kwargs, event, finalizers, deletion_ts, annotations, content
     check_kwargs(cause, kwargs)
 
 
-@doesnt_require_finalizer
-@no_finalizers
-@no_deletions
-@regular_events
-def test_for_create_skip_acquire(kwargs, event, finalizers, deletion_ts, requires_finalizer):
-    event = {'type': event, 'object': {'metadata': {}}}
-    event['object']['metadata'].update(finalizers)
-    event['object']['metadata'].update(deletion_ts)
+def test_for_create_skip_acquire(kwargs, regular_event, no_finalizers, no_deletions,
+                                 doesnt_require_finalizer):
+    event = make_event(regular_event, no_finalizers, no_deletions)
     cause = detect_resource_changing_cause(
         event=event,
-        requires_finalizer=requires_finalizer,
+        requires_finalizer=doesnt_require_finalizer,
         **kwargs)
     assert cause.reason == Reason.CREATE
     check_kwargs(cause, kwargs)
 
 
-@requires_finalizer
-@matching_lastseen
-@our_finalizers
-@no_deletions
-@regular_events
-def test_for_no_op(kwargs, event, finalizers, deletion_ts, annotations, content, requires_finalizer):
-    event = {'type': event, 'object': {'metadata': {}}}
-    event['object'].update(content)
-    event['object']['metadata'].update(finalizers)
-    event['object']['metadata'].update(deletion_ts)
-    event['object']['metadata'].update(annotations)
+def test_for_no_op(kwargs, regular_event, our_finalizers, no_deletions, matching_lastseen,
+                   content, requires_finalizer):
+    event = make_event(regular_event, our_finalizers, no_deletions, matching_lastseen, content)
     cause = detect_resource_changing_cause(
         event=event,
         requires_finalizer=requires_finalizer,
@@ -263,17 +142,9 @@ def test_for_no_op(kwargs, event, finalizers, deletion_ts, annotations, content,
     check_kwargs(cause, kwargs)
 
 
-@requires_finalizer
-@mismatching_lastseen
-@our_finalizers
-@no_deletions
-@regular_events
-def test_for_update(kwargs, event, finalizers, deletion_ts, annotations, content, requires_finalizer):
-    event = {'type': event, 'object': {'metadata': {}}}
-    event['object'].update(content)
-    event['object']['metadata'].update(finalizers)
-    event['object']['metadata'].update(deletion_ts)
-    event['object']['metadata'].update(annotations)
+def test_for_update(kwargs, regular_event, our_finalizers, no_deletions, mismatching_lastseen,
+                    content, requires_finalizer):
+    event = make_event(regular_event, our_finalizers, no_deletions, mismatching_lastseen, content)
     cause = detect_resource_changing_cause(
         event=event,
         requires_finalizer=requires_finalizer,
@@ -82,31 +82,28 @@ class HandlersContainer:
     resume_fn: Callable
 
 
-@pytest.fixture()
-def handlers(clear_default_registry):
+# The functions and their mocks are built only once per session: per-test, they
+# are reset and re-registered into the per-test default registry. This avoids
+# re-creating ten function objects and ten mocks per parametrized test.
+def _build_handlers_container() -> HandlersContainer:
     event_mock = Mock(return_value=None)
     create_mock = Mock(return_value=None)
     update_mock = Mock(return_value=None)
     delete_mock = Mock(return_value=None)
     resume_mock = Mock(return_value=None)
 
-    @kopf.on.event('zalando.org', 'v1', 'kopfexamples', id='event_fn')
     async def event_fn(**kwargs):
         return event_mock(**kwargs)
 
-    @kopf.on.create('zalando.org', 'v1', 'kopfexamples', id='create_fn', timeout=600)
     async def create_fn(**kwargs):
         return create_mock(**kwargs)
 
-    @kopf.on.update('zalando.org', 'v1', 'kopfexamples', id='update_fn', timeout=600)
     async def update_fn(**kwargs):
         return update_mock(**kwargs)
 
-    @kopf.on.delete('zalando.org', 'v1', 'kopfexamples', id='delete_fn', timeout=600)
     async def delete_fn(**kwargs):
         return delete_mock(**kwargs)
 
-    @kopf.on.resume('zalando.org', 'v1', 'kopfexamples', id='resume_fn', timeout=600)
     async def resume_fn(**kwargs):
         return resume_mock(**kwargs)
 
@@ -124,46 +121,53 @@ def handlers(clear_default_registry):
     )
 
 
-@pytest.fixture()
-def extrahandlers(clear_default_registry, handlers):
-    event_mock = Mock(return_value=None)
-    create_mock = Mock(return_value=None)
-    update_mock = Mock(return_value=None)
-    delete_mock = Mock(return_value=None)
-    resume_mock = Mock(return_value=None)
+def _reset_handlers_container(container: HandlersContainer) -> None:
+    for mock in (container.event_mock, container.create_mock, container.update_mock,
+                 container.delete_mock, container.resume_mock):
+        mock.reset_mock(return_value=True, side_effect=True)
+        mock.return_value = None  # the per-test side effects are gone by now
 
-    @kopf.on.event('zalando.org', 'v1', 'kopfexamples', id='event_fn2')
-    async def event_fn2(**kwargs):
-        return event_mock(**kwargs)
 
-    @kopf.on.create('zalando.org', 'v1', 'kopfexamples', id='create_fn2')
-    async def create_fn2(**kwargs):
-        return create_mock(**kwargs)
+@pytest.fixture(scope='session')
+def _handlers_container():
+    return _build_handlers_container()
 
-    @kopf.on.update('zalando.org', 'v1', 'kopfexamples', id='update_fn2')
-    async def update_fn2(**kwargs):
-        return update_mock(**kwargs)
 
-    @kopf.on.delete('zalando.org', 'v1', 'kopfexamples', id='delete_fn2')
-    async def delete_fn2(**kwargs):
-        return delete_mock(**kwargs)
+@pytest.fixture(scope='session')
+def _extrahandlers_container():
+    return _build_handlers_container()
 
-    @kopf.on.resume('zalando.org', 'v1', 'kopfexamples', id='resume_fn2')
-    async def resume_fn2(**kwargs):
-        return resume_mock(**kwargs)
 
-    return HandlersContainer(
-        event_mock=event_mock,
-        create_mock=create_mock,
-        update_mock=update_mock,
-        delete_mock=delete_mock,
-        resume_mock=resume_mock,
-        event_fn=event_fn2,
-        create_fn=create_fn2,
-        update_fn=update_fn2,
-        delete_fn=delete_fn2,
-        resume_fn=resume_fn2,
-    )
+@pytest.fixture()
+def handlers(clear_default_registry, _handlers_container):
+    _reset_handlers_container(_handlers_container)
+    kopf.on.event('zalando.org', 'v1', 'kopfexamples',
+                  id='event_fn')(_handlers_container.event_fn)
+    kopf.on.create('zalando.org', 'v1', 'kopfexamples',
+                   id='create_fn', timeout=600)(_handlers_container.create_fn)
+    kopf.on.update('zalando.org', 'v1', 'kopfexamples',
+                   id='update_fn', timeout=600)(_handlers_container.update_fn)
+    kopf.on.delete('zalando.org', 'v1', 'kopfexamples',
+                   id='delete_fn', timeout=600)(_handlers_container.delete_fn)
+    kopf.on.resume('zalando.org', 'v1', 'kopfexamples',
+                   id='resume_fn', timeout=600)(_handlers_container.resume_fn)
+    return _handlers_container
+
+
+@pytest.fixture()
+def extrahandlers(clear_default_registry, handlers, _extrahandlers_container):
+    _reset_handlers_container(_extrahandlers_container)
+    kopf.on.event('zalando.org', 'v1', 'kopfexamples',
+                  id='event_fn2')(_extrahandlers_container.event_fn)
+    kopf.on.create('zalando.org', 'v1', 'kopfexamples',
+                   id='create_fn2')(_extrahandlers_container.create_fn)
+    kopf.on.update('zalando.org', 'v1', 'kopfexamples',
+                   id='update_fn2')(_extrahandlers_container.update_fn)
+    kopf.on.delete('zalando.org', 'v1', 'kopfexamples',
+                   id='delete_fn2')(_extrahandlers_container.delete_fn)
+    kopf.on.resume('zalando.org', 'v1', 'kopfexamples',
+                   id='resume_fn2')(_extrahandlers_container.resume_fn)
+    return _extrahandlers_container
 
 
 @pytest.fixture()
@@ -79,6 +79,9 @@ async def test_delayed_handlers_sleep(
     # make sure the finalizer is added since there are mandatory deletion handlers
     cause_mock.body.setdefault('metadata', {})['finalizers'] = [FINALIZER]
 
+    # 1st sleep is not interrupted (re-check the handlers locally), 2nd one is (by new events).
+    k8s_mocked.sleep_or_wait.side_effect = [None, 1.23]
+
     with freezegun.freeze_time(now):
         await resource_handler(
             lifecycle=kopf.lifecycles.all_at_once,
@@ -95,14 +98,17 @@ async def test_delayed_handlers_sleep(
     assert not handlers.delete_mock.called
     assert not handlers.resume_mock.called
 
-    # The dummy patch is needed to trigger the further changes. The value is irrelevant.
-    assert k8s_mocked.patch_obj.called
-    assert 'dummy' in k8s_mocked.patch_obj.call_args_list[-1][1]['patch']['status']['kopf']
+    # No dummy patches are issued: the re-checking happens locally, with no API calls.
+    assert not k8s_mocked.patch_obj.called
 
-    # The duration of sleep should be as expected.
-    assert k8s_mocked.sleep_or_wait.called
+    # The handlers are re-checked after the uninterrupted sleep, and slept for again.
+    assert k8s_mocked.sleep_or_wait.call_count == 2
     assert k8s_mocked.sleep_or_wait.call_args_list[0][0][0] == delay
+    assert k8s_mocked.sleep_or_wait.call_args_list[1][0][0] == delay
 
     assert_logs([
         r"Sleeping for [\d\.]+ seconds",
+        r"Re-checking the delayed handlers",
+        r"Sleeping for [\d\.]+ seconds",
+        r"Sleeping was interrupted by new changes",
     ])
@@ -7,8 +7,20 @@ from kopf.reactor.causation import Reason, HANDLER_REASONS
 from kopf.reactor.handling import resource_handler
 
 
+# The tests only check these primitives with is_set(), never set or await them,
+# so one module-wide trio is enough for the whole parametrization matrix.
+@pytest.fixture(scope='module')
+def _loop_primitives():
+    return dict(
+        freeze=asyncio.Event(),
+        replenished=asyncio.Event(),
+        event_queue=asyncio.Queue(),
+    )
+
+
 @pytest.mark.parametrize('cause_type', HANDLER_REASONS)
 async def test_1st_step_stores_progress_by_patching(
+        _loop_primitives,
         registry, handlers, extrahandlers,
         resource, cause_mock, cause_type, k8s_mocked):
     name1 = f'{cause_type}_fn'
@@ -21,9 +33,7 @@ async def test_1st_step_stores_progress_by_patching(
         registry=registry,
         resource=resource,
         event={'type': 'irrelevant', 'object': cause_mock.body},
-        freeze=asyncio.Event(),
-        replenished=asyncio.Event(),
-        event_queue=asyncio.Queue(),
+        **_loop_primitives,
     )
 
     assert handlers.create_mock.call_count == (1 if cause_type == Reason.CREATE else 0)
@@ -49,7 +59,7 @@ async def test_1st_step_stores_progress_by_patching(
 
 @pytest.mark.parametrize('cause_type', HANDLER_REASONS)
 async def test_2nd_step_finishes_the_handlers(
-        registry, handlers, extrahandlers,
+        _loop_primitives, registry, handlers, extrahandlers,
         resource, cause_mock, cause_type, k8s_mocked):
     name1 = f'{cause_type}_fn'
     name2 = f'{cause_type}_fn2'
@@ -67,9 +77,7 @@ async def test_2nd_step_finishes_the_handlers(
         registry=registry,
         resource=resource,
         event={'type': 'irrelevant', 'object': cause_mock.body},
-        freeze=asyncio.Event(),
-        replenished=asyncio.Event(),
-        event_queue=asyncio.Queue(),
+        **_loop_primitives,
     )
 
     assert extrahandlers.create_mock.call_count == (1 if cause_type == Reason.CREATE else 0)
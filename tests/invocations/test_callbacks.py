@@ -3,22 +3,23 @@ import logging
 import traceback
 
 import pytest
-from asynctest import MagicMock
+from asynctest import CoroutineMock, MagicMock
 
 from kopf.reactor.causation import ResourceChangingCause, Reason
 from kopf.reactor.invocation import invoke, is_async_fn
 from kopf.structs.patches import Patch
+from kopf.structs.resources import Resource
 
 STACK_TRACE_MARKER = object()
 
 
 def _find_marker():
-    marker_repr = repr(STACK_TRACE_MARKER)
-    stack = traceback.StackSummary.extract(traceback.walk_stack(None), capture_locals=True)
-    for frame in stack:
-        if 'stack_trace_marker' in frame.locals:
-            if frame.locals['stack_trace_marker'] == marker_repr:
-                return True
+    # Walk the raw frames instead of StackSummary.extract(capture_locals=True):
+    # the latter reprs every local of every frame (incl. pytest's own huge
+    # objects) before the search even begins; one dict lookup per frame is enough.
+    for frame, _ in traceback.walk_stack(None):
+        if frame.f_locals.get('stack_trace_marker') is STACK_TRACE_MARKER:
+            return True
     return False
 
 
@@ -37,44 +38,77 @@ def partials(fn, n):
     return partial
 
 
+# Callable classes instead of closures: delegation goes through a plain
+# attribute instead of a closure cell, and ``update_wrapper`` still exposes
+# the ``__wrapped__`` chain that ``is_async_fn`` walks.
+class _Wrapper:
+    def __init__(self, inner):
+        self.inner = inner
+        functools.update_wrapper(self, inner, updated=())
+
+    def __call__(self, *args, **kwargs):
+        return self.inner(*args, **kwargs)
+
+
+class _AsyncWrapper(_Wrapper):
+    async def __call__(self, *args, **kwargs):
+        return await self.inner(*args, **kwargs)
+
+
+def _wrap(inner):
+    return _Wrapper(inner)
+
+
+def _await(inner):
+    return _AsyncWrapper(inner)
+
+
 def wrappers(fn, n):
     wrapper = fn
     for _ in range(n):
-        @functools.wraps(wrapper)
-        def wrapper(*args, wrapper=wrapper, **kwargs):
-            return wrapper(*args, **kwargs)
+        wrapper = _wrap(wrapper)
     return wrapper
 
 
 def awaiters(fn, n):
     wrapper = fn
     for _ in range(n):
-        @functools.wraps(wrapper)
-        async def wrapper(*args, wrapper=wrapper, **kwargs):
-            return await wrapper(*args, **kwargs)
+        wrapper = _await(wrapper)
     return wrapper
 
 
 def partials_wrappers(fn, n):
     wrapper = fn
     for _ in range(n):
-        wrapper = functools.partial(wrapper)
-        @functools.wraps(wrapper)
-        def wrapper(*args, wrapper=wrapper, **kwargs):
-            return wrapper(*args, **kwargs)
+        wrapper = _wrap(functools.partial(wrapper))
     return wrapper
 
 
 def partials_awaiters(fn, n):
     wrapper = fn
     for _ in range(n):
-        wrapper = functools.partial(wrapper)
-        @functools.wraps(wrapper)
-        async def wrapper(*args, wrapper=wrapper, **kwargs):
-            return await wrapper(*args, **kwargs)
+        wrapper = _await(functools.partial(wrapper))
     return wrapper
 
 
+# The chains are built once at import into named constants, not in the parametrize
+# argument lists: the lists are evaluated on every collection (incl. per xdist worker),
+# while the constants let the same chain objects be shared by all the parametrizations.
+SYNC_PARTIAL_ONCE = partials(sync_fn, 1)
+ASYNC_PARTIAL_ONCE = partials(async_fn, 1)
+SYNC_PARTIAL_MANY = partials(sync_fn, 9)
+ASYNC_PARTIAL_MANY = partials(async_fn, 9)
+SYNC_WRAPPER_ONCE = wrappers(sync_fn, 1)
+ASYNC_WRAPPER_ONCE = wrappers(async_fn, 1)
+SYNC_WRAPPER_MANY = wrappers(sync_fn, 9)
+ASYNC_WRAPPER_MANY = wrappers(async_fn, 9)
+ASYNC_AWAITER_ONCE = awaiters(async_fn, 1)
+ASYNC_AWAITER_MANY = awaiters(async_fn, 9)
+SYNC_MIXED_MANY = partials_wrappers(sync_fn, 9)
+ASYNC_MIXED_MANY = partials_wrappers(async_fn, 9)
+ASYNC_MIXED_AWAITERS_MANY = partials_awaiters(async_fn, 9)
+
+
 fns = pytest.mark.parametrize(
     'fn', [
         (sync_fn),
@@ -86,19 +120,19 @@ syncasyncparams = pytest.mark.parametrize(
     'fn, expected', [
         (sync_fn, False),
         (async_fn, True),
-        (partials(sync_fn, 1), False),
-        (partials(async_fn, 1), True),
-        (partials(sync_fn, 9), False),
-        (partials(async_fn, 9), True),
-        (wrappers(sync_fn, 1), False),
-        (wrappers(async_fn, 1), True),
-        (wrappers(sync_fn, 9), False),
-        (wrappers(async_fn, 9), True),
-        (awaiters(async_fn, 1), True),
-        (awaiters(async_fn, 9), True),
-        (partials_wrappers(sync_fn, 9), False),
-        (partials_wrappers(async_fn, 9), True),
-        (partials_awaiters(async_fn, 9), True),
+        (SYNC_PARTIAL_ONCE, False),
+        (ASYNC_PARTIAL_ONCE, True),
+        (SYNC_PARTIAL_MANY, False),
+        (ASYNC_PARTIAL_MANY, True),
+        (SYNC_WRAPPER_ONCE, False),
+        (ASYNC_WRAPPER_ONCE, True),
+        (SYNC_WRAPPER_MANY, False),
+        (ASYNC_WRAPPER_MANY, True),
+        (ASYNC_AWAITER_ONCE, True),
+        (ASYNC_AWAITER_MANY, True),
+        (SYNC_MIXED_MANY, False),
+        (ASYNC_MIXED_MANY, True),
+        (ASYNC_MIXED_AWAITERS_MANY, True),
     ], ids=[
         'sync-direct',
         'async-direct',
@@ -123,6 +157,16 @@ async def test_detection_for_none():
     assert not is_async
 
 
+async def test_detection_for_unhashable():
+    # Unhashable callables bypass the verdict cache, but are still detected.
+    class Unhashable:
+        __hash__ = None
+        def __call__(self):
+            pass
+    is_async = is_async_fn(Unhashable())
+    assert not is_async
+
+
 @syncasyncparams
 async def test_async_detection(fn, expected):
     is_async = is_async_fn(fn)
@@ -136,16 +180,22 @@ async def test_stacktrace_visibility(fn, expected):
     assert found is expected
 
 
+# Specless mocks of the same sync-/async-ness: a spec'ed mock mirrors every
+# attribute of the fn and introspects its signature, which the tests never use.
+def _mock_fn(fn, **kwargs):
+    return (CoroutineMock if is_async_fn(fn) else MagicMock)(**kwargs)
+
+
 @fns
 async def test_result_returned(fn):
-    fn = MagicMock(fn, return_value=999)
+    fn = _mock_fn(fn, return_value=999)
     result = await invoke(fn)
     assert result == 999
 
 
 @fns
 async def test_explicit_args_passed_properly(fn):
-    fn = MagicMock(fn)
+    fn = _mock_fn(fn)
     await invoke(fn, 100, 200, kw1=300, kw2=400)
 
     assert fn.called
@@ -160,16 +210,18 @@ async def test_explicit_args_passed_properly(fn):
     assert fn.call_args[1]['kw2'] == 400
 
 
-@fns
-async def test_special_kwargs_added(fn, resource):
+@pytest.fixture(scope='module')
+def _sample_cause():
+    # Only read by the tests, so one instance is shared by all parametrizations.
+    # The resource is built here directly: the `resource` fixture is function-scoped.
     body = {'metadata': {'uid': 'uid', 'name': 'name', 'namespace': 'ns'},
             'spec': {'field': 'value'},
             'status': {'info': 'payload'}}
 
     # Values can be any.
-    cause = ResourceChangingCause(
+    return ResourceChangingCause(
         logger=logging.getLogger('kopf.test.fake.logger'),
-        resource=resource,
+        resource=Resource('zalando.org', 'v1', 'kopfexamples'),
         patch=Patch(),
         initial=False,
         reason=Reason.NOOP,
@@ -179,7 +231,11 @@ async def test_special_kwargs_added(fn, resource):
         new=object(),
     )
 
-    fn = MagicMock(fn)
+
+@fns
+async def test_special_kwargs_added(fn, _sample_cause):
+    cause = _sample_cause
+    fn = _mock_fn(fn)
     await invoke(fn, cause=cause)
 
     assert fn.called
@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+
+from kopf.engines.patching import apply_obj, patcher, K8sPatch
+from kopf.structs.patches import Patch
+from kopf.structs.resources import Resource
+
+RESOURCE1 = Resource('group1', 'version1', 'plural1')
+RESOURCE2 = Resource('group2', 'version2', 'plural2')
+OBJ1 = {'metadata': {'uid': 'uid1', 'name': 'name1', 'namespace': 'ns1'}}
+OBJ2 = {'metadata': {'uid': 'uid2', 'name': 'name2', 'namespace': 'ns2'}}
+
+
+async def test_applying_directly_without_queue(mocker):
+    patch_obj = mocker.patch('kopf.clients.patching.patch_obj')
+    patch = Patch({'x': 'y'})
+
+    await apply_obj(resource=RESOURCE1, patch=patch, body=OBJ1)
+
+    assert patch_obj.called
+    assert patch_obj.call_args_list[0][1]['resource'] == RESOURCE1
+    assert patch_obj.call_args_list[0][1]['patch'] == {'x': 'y'}
+    assert patch_obj.call_args_list[0][1]['body'] == OBJ1
+
+
+async def test_queueing_with_queue(mocker):
+    patch_obj = mocker.patch('kopf.clients.patching.patch_obj')
+    patch_queue = asyncio.Queue()
+    patch = Patch({'x': 'y'})
+
+    await apply_obj(resource=RESOURCE1, patch=patch, body=OBJ1, patch_queue=patch_queue)
+
+    assert not patch_obj.called
+    assert patch_queue.qsize() == 1
+    k8s_patch = patch_queue.get_nowait()
+    assert isinstance(k8s_patch, K8sPatch)
+    assert k8s_patch.resource == RESOURCE1
+    assert k8s_patch.patch == {'x': 'y'}
+    assert k8s_patch.body == OBJ1
+
+
+async def test_patcher_polls_and_patches(mocker):
+    patch_queue = asyncio.Queue()
+    patch_queue.put_nowait(K8sPatch(resource=RESOURCE1, body=OBJ1, patch=Patch({'a': 1})))
+    patch_queue.put_nowait(K8sPatch(resource=RESOURCE2, body=OBJ2, patch=Patch({'b': 2})))
+
+    # A way to cancel `while True` cycle when we need it (ASAP).
+    def _cancel(*args, **kwargs):
+        if patch_obj.call_count >= 2:
+            raise asyncio.CancelledError()
+    patch_obj = mocker.patch('kopf.clients.patching.patch_obj', side_effect=_cancel)
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(
+            patcher(patch_queue=patch_queue), timeout=0.5)
+
+    assert patch_obj.call_count == 2
+    assert patch_obj.call_args_list[0][1]['resource'] == RESOURCE1
+    assert patch_obj.call_args_list[0][1]['patch'] == {'a': 1}
+    assert patch_obj.call_args_list[1][1]['resource'] == RESOURCE2
+    assert patch_obj.call_args_list[1][1]['patch'] == {'b': 2}
+
+
+async def test_patcher_coalesces_same_object_patches(mocker):
+    patch_queue = asyncio.Queue()
+    patch_queue.put_nowait(K8sPatch(resource=RESOURCE1, body=OBJ1,
+                                    patch=Patch({'status': {'x': 1, 'y': 1}})))
+    patch_queue.put_nowait(K8sPatch(resource=RESOURCE2, body=OBJ2,
+                                    patch=Patch({'status': {'z': 3}})))
+    patch_queue.put_nowait(K8sPatch(resource=RESOURCE1, body=OBJ1,
+                                    patch=Patch({'status': {'y': 2}})))
+
+    def _cancel(*args, **kwargs):
+        if patch_obj.call_count >= 2:
+            raise asyncio.CancelledError()
+    patch_obj = mocker.patch('kopf.clients.patching.patch_obj', side_effect=_cancel)
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(
+            patcher(patch_queue=patch_queue), timeout=0.5)
+
+    # Both patches of the 1st object are merged into one call; the later values win.
+    assert patch_obj.call_count == 2
+    assert patch_obj.call_args_list[0][1]['resource'] == RESOURCE1
+    assert patch_obj.call_args_list[0][1]['patch'] == {'status': {'x': 1, 'y': 2}}
+    assert patch_obj.call_args_list[1][1]['resource'] == RESOURCE2
+    assert patch_obj.call_args_list[1][1]['patch'] == {'status': {'z': 3}}
+
+
+async def test_patcher_contains_per_object_errors(mocker):
+    patch_queue = asyncio.Queue()
+    patch_queue.put_nowait(K8sPatch(resource=RESOURCE1, body=OBJ1, patch=Patch({'a': 1})))
+    patch_queue.put_nowait(K8sPatch(resource=RESOURCE2, body=OBJ2, patch=Patch({'b': 2})))
+
+    # The 1st object's patch fails; the 2nd must still be attempted.
+    def _fail_then_cancel(*args, **kwargs):
+        if patch_obj.call_count == 1:
+            raise Exception("boom")
+        raise asyncio.CancelledError()
+    patch_obj = mocker.patch('kopf.clients.patching.patch_obj', side_effect=_fail_then_cancel)
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(
+            patcher(patch_queue=patch_queue), timeout=0.5)
+
+    assert patch_obj.call_count == 2
+
+
+async def test_inflight_patches_are_limited(mocker):
+    mocker.patch('kopf.config.WorkersConfig.patching_inflight_limit', 1)
+
+    inflight = 0
+    overlapped = False
+
+    async def _slow_patch(*args, **kwargs):
+        nonlocal inflight, overlapped
+        inflight += 1
+        overlapped = overlapped or inflight > 1
+        await asyncio.sleep(0.01)
+        inflight -= 1
+
+    patch_obj = mocker.patch('kopf.clients.patching.patch_obj', side_effect=_slow_patch)
+
+    await asyncio.gather(
+        apply_obj(resource=RESOURCE1, patch=Patch({'a': 1}), body=OBJ1),
+        apply_obj(resource=RESOURCE2, patch=Patch({'b': 2}), body=OBJ2),
+    )
+
+    assert patch_obj.call_count == 2
+    assert not overlapped
+
+
+async def test_patcher_does_not_affect_queued_patches(mocker):
+    patch1 = Patch({'status': {'x': 1}})
+    patch2 = Patch({'status': {'x': 2}})
+    patch_queue = asyncio.Queue()
+    patch_queue.put_nowait(K8sPatch(resource=RESOURCE1, body=OBJ1, patch=patch1))
+    patch_queue.put_nowait(K8sPatch(resource=RESOURCE1, body=OBJ1, patch=patch2))
+
+    def _cancel(*args, **kwargs):
+        raise asyncio.CancelledError()
+    patch_obj = mocker.patch('kopf.clients.patching.patch_obj', side_effect=_cancel)
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(
+            patcher(patch_queue=patch_queue), timeout=0.5)
+
+    # The merging must happen on a copy, not on the originally queued patches.
+    assert patch1 == {'status': {'x': 1}}
+    assert patch2 == {'status': {'x': 2}}
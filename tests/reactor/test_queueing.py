@@ -12,15 +12,18 @@ If the intentions change, the tests should be rewritten.
 They are NOT part of the public interface of the framework.
 """
 import asyncio
+import itertools
 import weakref
 
 import pytest
 
 from kopf.reactor.queueing import watcher, EOS
+from kopf.reactor.queueing import worker as original_worker
 
-# An overhead for the sync logic in async tests. Guesstimated empirically:
-# 10ms is too fast, 200ms is too slow, 50-150ms is good enough (can vary).
-CODE_OVERHEAD = 0.130
+# An overhead for the sync logic in async tests. Guesstimated empirically.
+# The loop bootstrap cost is excluded by the warm-up fixture (see conftest),
+# so the budget covers only the code itself: 10ms is too fast, 50ms is good enough.
+CODE_OVERHEAD = 0.050
 
 
 @pytest.mark.parametrize('uids, cnts, events', [
@@ -80,14 +83,16 @@ async def test_watchevent_demultiplexing(worker_mock, timer, resource, handler,
         assert key == (resource, uid)
         assert key in streams
 
-        queue_events = []
-        while not streams[key].watchevents.empty():
-            queue_events.append(streams[key].watchevents.get_nowait())
+        # Snapshot the queue's underlying deque in one shot instead of a
+        # get_nowait() loop -- the test inspects the internal state anyway.
+        backlog = streams[key].watchevents._queue
+        queue_events = list(backlog)
+        backlog.clear()
 
         assert len(queue_events) == cnt + 1
         assert queue_events[-1] is EOS.token
         assert all(queue_event['object']['metadata']['uid'] == uid
-                   for queue_event in queue_events[:-1])
+                   for queue_event in itertools.islice(queue_events, len(queue_events) - 1))
 
 
 @pytest.mark.parametrize('uids, vals, events', [
@@ -167,18 +172,31 @@ async def test_watchevent_batching(mocker, resource, handler, timer, stream, eve
 async def test_garbage_collection_of_streams(mocker, stream, events, unique, worker_spy):
 
     # Override the default timeouts to make the tests faster.
-    mocker.patch('kopf.config.WorkersConfig.worker_idle_timeout', 0.5)
-    mocker.patch('kopf.config.WorkersConfig.worker_batch_window', 0.1)
+    # The GC semantics only need the idle timeout to trigger, not to be long:
+    # the waiting below is pure wall-clock idle, so the timeouts are minimal.
+    mocker.patch('kopf.config.WorkersConfig.worker_idle_timeout', 0.05)
+    mocker.patch('kopf.config.WorkersConfig.worker_batch_window', 0.01)
     mocker.patch('kopf.config.WorkersConfig.worker_exit_timeout', 0.5)
     mocker.patch('kopf.config.WatchersConfig.watcher_retry_delay', 1.0)  # to prevent src depletion
 
+    # Signal when all the workers are spawned -- instead of polling the spy
+    # in a busy-loop, which wastes the loop cycles and obscures the timing.
+    spawned = asyncio.Event()
+
+    async def worker_with_signal(*args, **kwargs):
+        if worker_spy.call_count >= unique:
+            spawned.set()
+        return await original_worker(*args, **kwargs)
+
+    worker_spy.side_effect = worker_with_signal
+
     # Inject the events of unique objects - to produce few streams/workers.
     stream.feed(events)
 
-    # Give it a moment to populate the streams and spawn all the workers.
+    # Wait until the streams are populated and all the workers are spawned.
     # Intercept and remember _any_ seen dict of streams for further checks.
-    while worker_spy.call_count < unique:
-        await asyncio.sleep(0.001)  # give control to the loop
+    # Mind the watcher retry delay: the events arrive on the 2nd iteration.
+    await asyncio.wait_for(spawned.wait(), timeout=5.0)
     streams = worker_spy.call_args_list[-1][1]['streams']
 
     # The mutable(!) streams dict is now populated with the objects' streams.
@@ -0,0 +1,103 @@
+from unittest.mock import Mock
+
+from kopf import OperatorRegistry
+
+
+# Used in the tests. Must be global-scoped, or its qualname will be affected.
+def some_fn():
+    pass
+
+
+def some_other_fn():
+    pass
+
+
+def _cause(resource, **kwargs):
+    body = {'metadata': {'labels': {'somelabel': 'somevalue'},
+                         'annotations': {'someannotation': 'somevalue'}}}
+    defaults = dict(resource=resource, reason='some-reason', initial=False, diff=None, body=body)
+    defaults.update(kwargs)
+    return Mock(**defaults)
+
+
+def test_selection_is_memoized(resource):
+    registry = OperatorRegistry()
+    registry.register_resource_changing_handler(
+        resource.group, resource.version, resource.plural, some_fn)
+
+    handlers1 = registry.get_resource_changing_handlers(_cause(resource))
+    handlers2 = registry.get_resource_changing_handlers(_cause(resource))
+
+    assert handlers1 is handlers2
+    assert [h.fn for h in handlers1] == [some_fn]
+
+
+def test_cache_is_invalidated_by_registration(resource):
+    registry = OperatorRegistry()
+    registry.register_resource_changing_handler(
+        resource.group, resource.version, resource.plural, some_fn)
+    handlers1 = registry.get_resource_changing_handlers(_cause(resource))
+
+    registry.register_resource_changing_handler(
+        resource.group, resource.version, resource.plural, some_other_fn)
+    handlers2 = registry.get_resource_changing_handlers(_cause(resource))
+
+    assert [h.fn for h in handlers1] == [some_fn]
+    assert [h.fn for h in handlers2] == [some_fn, some_other_fn]
+
+
+def test_causes_differ_by_filtered_labels(resource):
+    registry = OperatorRegistry()
+    registry.register_resource_changing_handler(
+        resource.group, resource.version, resource.plural, some_fn,
+        labels={'somelabel': 'somevalue'})
+
+    matching_body = {'metadata': {'labels': {'somelabel': 'somevalue'}}}
+    mismatch_body = {'metadata': {'labels': {'somelabel': 'othervalue'}}}
+    handlers1 = registry.get_resource_changing_handlers(_cause(resource, body=matching_body))
+    handlers2 = registry.get_resource_changing_handlers(_cause(resource, body=mismatch_body))
+
+    assert [h.fn for h in handlers1] == [some_fn]
+    assert [h.fn for h in handlers2] == []
+
+
+def test_requires_finalizer_is_memoized_per_filtered_labels(resource):
+    registry = OperatorRegistry()
+    registry.register_resource_changing_handler(
+        resource.group, resource.version, resource.plural, some_fn,
+        requires_finalizer=True, labels={'somelabel': 'somevalue'})
+
+    matching_body = {'metadata': {'labels': {'somelabel': 'somevalue'}}}
+    mismatch_body = {'metadata': {'labels': {'somelabel': 'othervalue'}}}
+
+    assert registry.requires_finalizer(resource, matching_body) is True
+    assert registry.requires_finalizer(resource, mismatch_body) is False
+    assert registry.requires_finalizer(resource, matching_body) is True
+
+
+def test_requires_finalizer_cache_is_invalidated_by_registration(resource):
+    registry = OperatorRegistry()
+    registry.register_resource_changing_handler(
+        resource.group, resource.version, resource.plural, some_fn)
+
+    body = {'metadata': {}}
+    assert registry.requires_finalizer(resource, body) is False
+
+    registry.register_resource_changing_handler(
+        resource.group, resource.version, resource.plural, some_other_fn,
+        requires_finalizer=True)
+    assert registry.requires_finalizer(resource, body) is True
+
+
+def test_causes_do_not_differ_by_unfiltered_annotations(resource):
+    registry = OperatorRegistry()
+    registry.register_resource_changing_handler(
+        resource.group, resource.version, resource.plural, some_fn)
+
+    body1 = {'metadata': {'annotations': {'volatile': 'value1'}}}
+    body2 = {'metadata': {'annotations': {'volatile': 'value2'}}}
+    handlers1 = registry.get_resource_changing_handlers(_cause(resource, body=body1))
+    handlers2 = registry.get_resource_changing_handlers(_cause(resource, body=body2))
+
+    # The volatile annotations are not in any filter, so the selection is shared.
+    assert handlers1 is handlers2
@@ -1,4 +1,7 @@
-import collections.abc
+from collections.abc import Collection, Container, Iterable, Iterator
+from types import SimpleNamespace
+
+import pytest
 
 from kopf import ResourceRegistry, OperatorRegistry
 
@@ -8,78 +11,97 @@ def some_fn():
     pass
 
 
-def test_simple_registry_via_iter(mocker):
-    cause = mocker.Mock(event=None, diff=None)
+# The eagerly materialized sequence types -- prebuilt to avoid a tuple
+# allocation and a two-way isinstance walk on every assertion.
+_SEQ_TYPES = (list, tuple)
 
-    registry = ResourceRegistry()
-    iterator = registry.iter_resource_changing_handlers(cause)
+# Marks the exhaustion of an iterator without materializing it into a list.
+_SENTINEL = object()
 
-    assert isinstance(iterator, collections.abc.Iterator)
-    assert not isinstance(iterator, collections.abc.Collection)
-    assert not isinstance(iterator, collections.abc.Container)
-    assert not isinstance(iterator, (list, tuple))
 
-    handlers = list(iterator)
-    assert not handlers
+# A plain namespace instead of a Mock: the registries only read a handful of
+# attributes, and the Mock construction machinery is orders slower than this.
+def _cause(**kwargs):
+    return SimpleNamespace(event=None, diff=None, reason=None, initial=False, body={}, **kwargs)
 
 
-def test_simple_registry_via_list(mocker):
-    cause = mocker.Mock(event=None, diff=None)
+@pytest.fixture()
+def simple_cause():
+    return _cause()
 
-    registry = ResourceRegistry()
-    handlers = registry.get_resource_changing_handlers(cause)
 
-    assert isinstance(handlers, collections.abc.Iterable)
-    assert isinstance(handlers, collections.abc.Container)
-    assert isinstance(handlers, collections.abc.Collection)
-    assert not handlers
+@pytest.fixture()
+def global_cause(resource):
+    return _cause(resource=resource)
 
 
-def test_simple_registry_with_minimal_signature(mocker):
-    cause = mocker.Mock(event=None, diff=None)
+@pytest.fixture()
+def resource_gvp(resource):
+    # The registration triple, resolved once per test instead of per call site.
+    return resource.group, resource.version, resource.plural
 
-    registry = ResourceRegistry()
-    registry.register(some_fn)
-    handlers = registry.get_resource_changing_handlers(cause)
 
-    assert len(handlers) == 1
-    assert handlers[0].fn is some_fn
+# The read-only tests never mutate the registries, so one empty instance of
+# each kind serves the whole module; tests that register handlers build their own.
+@pytest.fixture(scope='module')
+def empty_resource_registry():
+    return ResourceRegistry()
 
 
-def test_global_registry_via_iter(mocker, resource):
-    cause = mocker.Mock(resource=resource, event=None, diff=None)
+@pytest.fixture(scope='module')
+def empty_operator_registry():
+    return OperatorRegistry()
 
-    registry = OperatorRegistry()
-    iterator = registry.iter_resource_changing_handlers(cause)
 
-    assert isinstance(iterator, collections.abc.Iterator)
-    assert not isinstance(iterator, collections.abc.Collection)
-    assert not isinstance(iterator, collections.abc.Container)
-    assert not isinstance(iterator, (list, tuple))
+# The simple- & global-registry tests are the same modulo the registry kind and
+# the cause's resource, so one parametrized pair of fixtures drives them all.
+@pytest.fixture(params=['simple', 'global'])
+def registry_kind(request):
+    return request.param
 
-    handlers = list(iterator)
-    assert not handlers
 
+@pytest.fixture()
+def empty_registry_and_cause(registry_kind, empty_resource_registry, empty_operator_registry,
+                             simple_cause, global_cause):
+    if registry_kind == 'simple':
+        return empty_resource_registry, simple_cause
+    else:
+        return empty_operator_registry, global_cause
 
-def test_global_registry_via_list(mocker, resource):
-    cause = mocker.Mock(resource=resource, event=None, diff=None)
 
-    registry = OperatorRegistry()
-    handlers = registry.get_resource_changing_handlers(cause)
+@pytest.mark.parametrize('mode', ['iter', 'list'])
+def test_empty_registry(empty_registry_and_cause, mode):
+    registry, cause = empty_registry_and_cause
+
+    if mode == 'iter':
+        iterator = registry.iter_resource_changing_handlers(cause)
+
+        assert isinstance(iterator, Iterator)
+        assert not isinstance(iterator, Collection)
+        assert not isinstance(iterator, Container)
+        assert type(iterator) not in _SEQ_TYPES
 
-    assert isinstance(handlers, collections.abc.Iterable)
-    assert isinstance(handlers, collections.abc.Container)
-    assert isinstance(handlers, collections.abc.Collection)
-    assert not handlers
+        assert next(iterator, _SENTINEL) is _SENTINEL
+    else:
+        handlers = registry.get_resource_changing_handlers(cause)
 
+        assert isinstance(handlers, Iterable)
+        assert isinstance(handlers, Container)
+        assert isinstance(handlers, Collection)
+        assert not handlers
 
-def test_global_registry_with_minimal_signature(mocker, resource):
-    cause = mocker.Mock(resource=resource, event=None, diff=None)
 
-    registry = OperatorRegistry()
-    registry.register_resource_changing_handler(resource.group, resource.version, resource.plural, some_fn)
+def test_registry_with_minimal_signature(registry_kind, resource_gvp, simple_cause, global_cause):
+    if registry_kind == 'simple':
+        registry = ResourceRegistry()
+        registry.register(some_fn)
+        cause = simple_cause
+    else:
+        registry = OperatorRegistry()
+        registry.register_resource_changing_handler(*resource_gvp, some_fn)
+        cause = global_cause
+
     handlers = registry.get_resource_changing_handlers(cause)
 
     assert len(handlers) == 1
     assert handlers[0].fn is some_fn
-
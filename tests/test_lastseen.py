@@ -178,3 +178,44 @@ def test_essence_diff():
     assert old == {'spec': {'depth': {'field': 'x'}}}
     assert new == {'spec': {'depth': {'field': 'y'}}, 'status': {'x': 'y'}}
     assert len(diff) == 2  # spec.depth.field & status.x, but the order is not known.
+
+
+def test_essential_diffs_are_memoized_with_resource_version():
+    data = {'spec': {'depth': {'field': 'x'}}}
+    encoded = json.dumps(data)  # json formatting can vary across interpreters
+    body = {'metadata': {'uid': 'uid', 'resourceVersion': 'rv1',
+                         'annotations': {LAST_SEEN_ANNOTATION: encoded}},
+            'spec': {'depth': {'field': 'y'}}}
+    result1 = get_essential_diffs(body=body)
+    result2 = get_essential_diffs(body=body)
+    assert result1 == result2
+    assert result1 is not result2  # the cached original is never handed out.
+
+
+def test_essential_diffs_memoization_survives_mutation_by_the_caller():
+    data = {'spec': {'depth': {'field': 'x'}}}
+    encoded = json.dumps(data)  # json formatting can vary across interpreters
+    body = {'metadata': {'uid': 'uid', 'resourceVersion': 'rv2',
+                         'annotations': {LAST_SEEN_ANNOTATION: encoded}},
+            'spec': {'depth': {'field': 'y'}}}
+    old1, new1, diff1 = get_essential_diffs(body=body)
+
+    # The results go into the user-side handlers, which can mutate them in-place.
+    old1['spec']['depth']['field'] = 'mutated'
+    new1['spec'].clear()
+
+    old2, new2, diff2 = get_essential_diffs(body=body)
+    assert old2 == {'spec': {'depth': {'field': 'x'}}}
+    assert new2 == {'spec': {'depth': {'field': 'y'}}}
+
+
+def test_essential_diffs_are_not_memoized_without_resource_version():
+    data = {'spec': {'depth': {'field': 'x'}}}
+    encoded = json.dumps(data)  # json formatting can vary across interpreters
+    body = {'metadata': {'uid': 'uid',
+                         'annotations': {LAST_SEEN_ANNOTATION: encoded}},
+            'spec': {'depth': {'field': 'y'}}}
+    result1 = get_essential_diffs(body=body)
+    result2 = get_essential_diffs(body=body)
+    assert result1 is not result2
+    assert result1 == result2
@@ -36,3 +36,19 @@ async def test_sleep_or_wait_with_zero_time_and_event_preset(timer):
         unslept = await asyncio.wait_for(sleep_or_wait(0, event), timeout=1.0)
     assert timer.seconds <= 0.01
     assert not unslept  # 0/None; undefined for such case: both goals reached.
+
+
+async def test_sleep_or_wait_cancellation_reaps_the_waiter():
+    event = asyncio.Event()
+    task = asyncio.get_running_loop().create_task(sleep_or_wait(10, event))
+    await asyncio.sleep(0.01)  # let the sleeping start its inner waiter.
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+    # No orphaned `event.wait()` task may be left on the loop after cancellation.
+    pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task() and not t.done()]
+    assert not pending